@@ -154,7 +154,8 @@ public sealed class JsonDnsFailoverStateStore(string path) : IDnsFailoverStateSt
                 return new();
             }
 
-            var persisted = JsonSerializer.Deserialize<PersistedState>(File.ReadAllText(path), JsonOptions);
+            using var stream = File.OpenRead(path);
+            var persisted = JsonSerializer.Deserialize<PersistedState>(stream, JsonOptions);
             return persisted is null
                 ? new()
                 : new()
@@ -0,0 +1,56 @@
+namespace BeszelAgentManager.Core;
+
+public sealed class LogFolderWatcher : IDisposable
+{
+    private readonly List<FileSystemWatcher> _watchers = [];
+    private readonly List<string> _failures = [];
+    private int _changed = 1;
+
+    public LogFolderWatcher(params (string Directory, string Filter)[] folders)
+    {
+        foreach (var (directory, filter) in folders)
+        {
+            try
+            {
+                var watcher = new FileSystemWatcher(directory, filter)
+                {
+                    NotifyFilter = NotifyFilters.FileName,
+                };
+                watcher.Created += (_, _) => MarkChanged();
+                watcher.Deleted += (_, _) => MarkChanged();
+                watcher.Renamed += (_, _) => MarkChanged();
+                watcher.Error += (_, _) => MarkChanged();
+                watcher.EnableRaisingEvents = true;
+                _watchers.Add(watcher);
+            }
+            catch (Exception ex)
+            {
+                _failures.Add($"{directory}: {ex.Message}");
+            }
+        }
+    }
+
+    public bool IsComplete => _failures.Count == 0;
+
+    public IReadOnlyList<string> Failures => _failures;
+
+    public bool TakeChanges()
+    {
+        return Interlocked.Exchange(ref _changed, 0) == 1;
+    }
+
+    public void Dispose()
+    {
+        foreach (var watcher in _watchers)
+        {
+            watcher.Dispose();
+        }
+
+        _watchers.Clear();
+    }
+
+    private void MarkChanged()
+    {
+        Interlocked.Exchange(ref _changed, 1);
+    }
+}
@@ -0,0 +1,52 @@
+namespace BeszelAgentManager.Core;
+
+public sealed record LogTailResult(IReadOnlyList<string> Lines, long Length, bool EndsWithNewline);
+
+public static class LogTailReader
+{
+    public static async Task<LogTailResult> ReadLastLinesAsync(
+        Stream stream,
+        string filter,
+        int maxLines,
+        long maxBytes = long.MaxValue,
+        CancellationToken cancellationToken = default)
+    {
+        var truncated = stream.Length > maxBytes;
+        if (truncated)
+        {
+            // Start one byte early so a cut that lands exactly on a line start keeps that line.
+            stream.Seek(-(maxBytes + 1), SeekOrigin.End);
+        }
+
+        var lines = new Queue<string>();
+        using (var reader = new StreamReader(stream, leaveOpen: true))
+        {
+            if (truncated)
+            {
+                await reader.ReadLineAsync(cancellationToken);
+            }
+
+            while (await reader.ReadLineAsync(cancellationToken) is { } line)
+            {
+                if (maxLines > 0 && (filter.Length == 0 || line.Contains(filter, StringComparison.OrdinalIgnoreCase)))
+                {
+                    lines.Enqueue(line);
+                    if (lines.Count > maxLines)
+                    {
+                        lines.Dequeue();
+                    }
+                }
+            }
+        }
+
+        var length = stream.Position;
+        var endsWithNewline = false;
+        if (length > 0)
+        {
+            stream.Seek(length - 1, SeekOrigin.Begin);
+            endsWithNewline = stream.ReadByte() == '\n';
+        }
+
+        return new LogTailResult([.. lines], length, endsWithNewline);
+    }
+}
@@ -2,6 +2,7 @@ using System.Diagnostics;
 using System.IO.Compression;
 using System.IO.Pipes;
 using System.Net.Http.Headers;
+using System.Runtime.InteropServices;
 using System.Text.RegularExpressions;
 using System.Security.AccessControl;
 using System.Security.Cryptography;
@@ -273,12 +274,17 @@ static async Task RunBackgroundLoopAsync(CancellationToken cancellationToken)
     var failoverStore = new JsonDnsFailoverStateStore(
         Path.Combine(ProgramDataPath(), "BeszelAgentManager", "dns-fallback-state.json"));
     var state = failoverStore.Load();
+    var failoverCoordinator = new DnsFailoverCoordinator(
+        new DelegateDnsResolver(CanResolveHostAsync),
+        new DelegateAgentHubUrlConfiguration(ApplyBackgroundHubUrlAsync),
+        failoverStore,
+        SystemFailoverClock.Instance);
     var runtimeState = LoadBackgroundRuntimeState();
     WriteBackgroundLog("INFO", "Background service started");
     try
     {
         await Task.WhenAll(
-            RunBackgroundMonitoringLoopAsync(state, failoverStore, runtimeState, cancellationToken),
+            RunBackgroundMonitoringLoopAsync(state, failoverCoordinator, runtimeState, cancellationToken),
             RunBrokerServerAsync(cancellationToken));
     }
     catch (OperationCanceledException) when (cancellationToken.IsCancellationRequested)
@@ -297,13 +303,13 @@ static async Task RunBackgroundLoopAsync(CancellationToken cancellationToken)
 
 static async Task RunBackgroundMonitoringLoopAsync(
     DnsFailoverState state,
-    IDnsFailoverStateStore failoverStore,
+    DnsFailoverCoordinator failoverCoordinator,
     BackgroundRuntimeState runtimeState,
     CancellationToken cancellationToken)
 {
     while (!cancellationToken.IsCancellationRequested)
     {
-        await CheckHubFailoverAsync(state, failoverStore, cancellationToken);
+        await CheckHubFailoverAsync(state, failoverCoordinator, cancellationToken);
         await RunDueBackgroundSchedulesAsync(runtimeState, cancellationToken);
 
         using var cycleCancellation = CancellationTokenSource.CreateLinkedTokenSource(cancellationToken);
@@ -608,7 +614,7 @@ static async Task HandleBrokerConnectionAsync(
                 }
 
                 var installedVersion = await GetInstalledAgentVersionAsync(installedAgentPath);
-                var versionMatch = Regex.Match(installedVersion, @"^\d+\.\d+\.\d+(?:[-+][0-9A-Za-z.-]+)?$");
+                var versionMatch = HelperRegex.InstalledVersion().Match(installedVersion);
                 if (!versionMatch.Success)
                 {
                     await WriteBrokerResponseAsync(
@@ -740,7 +746,7 @@ static PipeSecurity CreateBrokerPipeSecurity(string authorizedSid)
 
 static async Task CheckHubFailoverAsync(
     DnsFailoverState state,
-    IDnsFailoverStateStore stateStore,
+    DnsFailoverCoordinator coordinator,
     CancellationToken cancellationToken)
 {
     using var config = await LoadConfigurationAsync();
@@ -754,11 +760,6 @@ static async Task CheckHubFailoverAsync(
     var fallback = ReadConfigString(root, "hub_url_ip_fallback");
     var enabled = root.TryGetProperty("hub_url_ip_fallback_enabled", out var enabledValue)
         && enabledValue.ValueKind == JsonValueKind.True;
-    var coordinator = new DnsFailoverCoordinator(
-        new DelegateDnsResolver(CanResolveHostAsync),
-        new DelegateAgentHubUrlConfiguration(ApplyBackgroundHubUrlAsync),
-        stateStore,
-        SystemFailoverClock.Instance);
     var events = await coordinator.CheckAsync(
         new(enabled, primary, fallback),
         state,
@@ -828,7 +829,8 @@ static BackgroundRuntimeState LoadBackgroundRuntimeState()
         var path = Path.Combine(ProgramDataPath(), "BeszelAgentManager", backgroundRuntimeStateFileName);
         if (File.Exists(path))
         {
-            return JsonSerializer.Deserialize<BackgroundRuntimeState>(File.ReadAllText(path))
+            using var stream = File.OpenRead(path);
+            return JsonSerializer.Deserialize<BackgroundRuntimeState>(stream)
                 ?? new BackgroundRuntimeState();
         }
     }
@@ -848,7 +850,7 @@ static async Task SaveBackgroundRuntimeStateAsync(BackgroundRuntimeState state)
     var temporaryPath = $"{path}.{Environment.ProcessId}.tmp";
     await File.WriteAllTextAsync(
         temporaryPath,
-        JsonSerializer.Serialize(state, new JsonSerializerOptions { WriteIndented = true }));
+        JsonSerializer.Serialize(state));
     File.Move(temporaryPath, path, overwrite: true);
 }
 
@@ -882,7 +884,7 @@ static void WriteBackgroundLog(string level, string message)
 
 static async Task<int> StartServiceAsync(string name)
 {
-    var result = await RunScAsync("start", name);
+    var result = await ControlServiceAsync("start", name);
     if (result == 0 || result == ServiceAlreadyRunning)
     {
         return await WaitForServiceStateAsync(name, "RUNNING", TimeSpan.FromSeconds(30)) ? 0 : 4;
@@ -899,7 +901,7 @@ static async Task<int> StopServiceAsync(string name, bool waitForCompletion = tr
         return 0;
     }
 
-    var result = await RunScAsync("stop", name);
+    var result = await ControlServiceAsync("stop", name);
     if (result == 0 || result == ServiceNotRunning)
     {
         return !waitForCompletion || await WaitForServiceStateAsync(name, "STOPPED", TimeSpan.FromSeconds(30)) ? 0 : 4;
@@ -1188,9 +1190,13 @@ static BrokerPolicy? LoadBrokerPolicy()
     try
     {
         var path = BrokerPolicyPath();
-        return File.Exists(path)
-            ? JsonSerializer.Deserialize<BrokerPolicy>(File.ReadAllText(path))
-            : null;
+        if (!File.Exists(path))
+        {
+            return null;
+        }
+
+        using var stream = File.OpenRead(path);
+        return JsonSerializer.Deserialize<BrokerPolicy>(stream);
     }
     catch
     {
@@ -1233,13 +1239,13 @@ static bool IsValidAccountSid(string? sid)
 static bool TryReadVersion(Dictionary<string, string> arguments, out string version)
 {
     version = arguments.GetValueOrDefault("version")?.Trim() ?? string.Empty;
-    return Regex.IsMatch(version, @"^v?\d+\.\d+\.\d+$", RegexOptions.CultureInvariant);
+    return HelperRegex.AgentVersionArgument().IsMatch(version);
 }
 
 static bool TryReadManagerTag(Dictionary<string, string> arguments, out string tag)
 {
     tag = arguments.GetValueOrDefault("tag")?.Trim() ?? string.Empty;
-    return Regex.IsMatch(tag, @"^v?\d+\.\d+\.\d+(?:-rc\d+)?$", RegexOptions.IgnoreCase | RegexOptions.CultureInvariant);
+    return HelperRegex.ManagerTagArgument().IsMatch(tag);
 }
 
 static bool TryReadBoolean(Dictionary<string, string> arguments, string key, out bool value)
@@ -1260,16 +1266,21 @@ static async Task<int> SetDefenderExclusionAsync(bool enabled)
     }
 
     var managerDirectory = managerDirectoryInfo.FullName.TrimEnd(Path.DirectorySeparatorChar);
-    var escapedPath = managerDirectory.Replace("'", "''", StringComparison.Ordinal);
     var command = enabled
-        ? $"Add-MpPreference -ExclusionPath '{escapedPath}'"
-        : $"Remove-MpPreference -ExclusionPath '{escapedPath}' -ErrorAction SilentlyContinue";
+        ? "Add-MpPreference -ExclusionPath $env:BESZEL_EXCLUSION_PATH"
+        : "Remove-MpPreference -ExclusionPath $env:BESZEL_EXCLUSION_PATH -ErrorAction SilentlyContinue";
     var result = await RunProcessAsync(
-        Path.Combine(Environment.SystemDirectory, "WindowsPowerShell", "v1.0", "powershell.exe"),
-        ["-NoProfile", "-NonInteractive", "-ExecutionPolicy", "Bypass", "-Command", command]);
+        PowerShellPath(),
+        ["-NoProfile", "-NonInteractive", "-ExecutionPolicy", "Bypass", "-Command", command],
+        new Dictionary<string, string> { ["BESZEL_EXCLUSION_PATH"] = managerDirectory });
     return result.ExitCode == 0 ? 0 : 4;
 }
 
+static string PowerShellPath()
+{
+    return Path.Combine(Environment.SystemDirectory, "WindowsPowerShell", "v1.0", "powershell.exe");
+}
+
 static void TryDeleteFile(string path)
 {
     try
@@ -1399,7 +1410,7 @@ static async Task<string> GetInstalledAgentVersionAsync(string agentPath)
                 agentPath,
                 [argument],
                 TimeSpan.FromSeconds(10));
-            var match = Regex.Match(result.Output, @"\d+\.\d+\.\d+");
+            var match = HelperRegex.SemVer().Match(result.Output);
             if (match.Success)
             {
                 return match.Value;
@@ -1979,38 +1990,6 @@ static string[] BuildAgentEnvironment(JsonElement config)
     AddValue("HUB_URL", "hub_url");
     AddValue("LISTEN", "listen");
 
-    var mapping = new Dictionary<string, string>(StringComparer.OrdinalIgnoreCase)
-    {
-        ["DATA_DIR"] = "data_dir",
-        ["DOCKER_HOST"] = "docker_host",
-        ["EXCLUDE_CONTAINERS"] = "exclude_containers",
-        ["EXCLUDE_SMART"] = "exclude_smart",
-        ["EXTRA_FILESYSTEMS"] = "extra_filesystems",
-        ["FILESYSTEM"] = "filesystem",
-        ["INTEL_GPU_DEVICE"] = "intel_gpu_device",
-        ["NVML"] = "nvml",
-        ["KEY_FILE"] = "key_file",
-        ["TOKEN_FILE"] = "token_file",
-        ["LHM"] = "lhm",
-        ["LOG_LEVEL"] = "log_level",
-        ["MEM_CALC"] = "mem_calc",
-        ["NETWORK"] = "network",
-        ["NICS"] = "nics",
-        ["SENSORS"] = "sensors",
-        ["SENSORS_TIMEOUT"] = "sensors_timeout",
-        ["PRIMARY_SENSOR"] = "primary_sensor",
-        ["SYS_SENSORS"] = "sys_sensors",
-        ["SERVICE_PATTERNS"] = "service_patterns",
-        ["SMART_DEVICES"] = "smart_devices",
-        ["SMART_INTERVAL"] = "smart_interval",
-        ["SYSTEM_NAME"] = "system_name",
-        ["SKIP_GPU"] = "skip_gpu",
-        ["GPU_COLLECTOR"] = "gpu_collector",
-        ["DISABLE_SSH"] = "disable_ssh",
-        ["DISK_USAGE_CACHE"] = "disk_usage_cache",
-        ["SKIP_SYSTEMD"] = "skip_systemd",
-    };
-
     if (config.TryGetProperty("env_active_names", out var activeNames)
         && activeNames.ValueKind == JsonValueKind.Array)
     {
@@ -2018,7 +1997,7 @@ static string[] BuildAgentEnvironment(JsonElement config)
         {
             var environmentName = item.GetString()?.Trim();
             if (string.IsNullOrWhiteSpace(environmentName)
-                || !mapping.TryGetValue(environmentName, out var configName))
+                || !AgentEnvironmentKeys.ConfigNames.TryGetValue(environmentName, out var configName))
             {
                 continue;
             }
@@ -2042,7 +2021,7 @@ static string[] BuildAgentEnvironment(JsonElement config)
             var value = valueProperty.ToString().Trim();
             if (!string.IsNullOrWhiteSpace(name)
                 && !string.IsNullOrWhiteSpace(value)
-                && Regex.IsMatch(name, @"^[A-Za-z_][A-Za-z0-9_]*$", RegexOptions.CultureInvariant)
+                && HelperRegex.EnvironmentName().IsMatch(name)
                 && value.IndexOfAny(['\0', '\r', '\n']) < 0
                 && name is not ("KEY" or "TOKEN" or "HUB_URL" or "LISTEN")
                 && !values.ContainsKey(name))
@@ -2075,85 +2054,33 @@ static string[] BuildAgentEnvironment(JsonElement config)
     }
 }
 
-static async Task<(bool Exists, string State, int Pid)> QueryServiceAsync(string name)
+static Task<(bool Exists, string State, int Pid)> QueryServiceAsync(string name)
 {
-    var result = await RunProcessAsync("sc.exe", ["queryex", name]);
-    if (ServiceQueryReportsMissing(result))
+    return Task.Run(() =>
     {
-        return (false, string.Empty, 0);
-    }
-
-    if (result.ExitCode != 0)
-    {
-        return (false, string.Empty, 0);
-    }
-
-    var state = ParseServiceState(result.Output);
-    var pid = 0;
-    using var reader = new StringReader(result.Output);
-    while (reader.ReadLine() is { } line)
-    {
-        var trimmed = line.Trim();
-        if (trimmed.StartsWith("PID", StringComparison.OrdinalIgnoreCase))
+        if (ServiceNative.QueryStatus(name) is not { } status)
         {
-            var parts = trimmed.Split(' ', StringSplitOptions.RemoveEmptyEntries);
-            if (parts.Length > 2 && int.TryParse(parts[2], out var parsedPid))
-            {
-                pid = parsedPid;
-            }
+            return (false, string.Empty, 0);
         }
-    }
-
-    return (true, state, pid);
-}
-
-static bool ServiceQueryReportsMissing((int ExitCode, string Output) result)
-{
-    if (result.ExitCode == 0)
-    {
-        return false;
-    }
 
-    return result.Output.Contains("1060", StringComparison.OrdinalIgnoreCase)
-        || result.Output.Contains("does not exist", StringComparison.OrdinalIgnoreCase);
+        var state = ServiceStateName(status.State);
+        return (true, state, IsStoppedState(state) ? 0 : status.ProcessId);
+    });
 }
 
-static string ParseServiceState(string output)
+static string ServiceStateName(int stateCode)
 {
-    var stateMatch = Regex.Match(output, @"STATE\s*:\s*(\d+)", RegexOptions.IgnoreCase);
-    if (stateMatch.Success && int.TryParse(stateMatch.Groups[1].Value, out var stateCode))
-    {
-        return stateCode switch
-        {
-            1 => "STOPPED",
-            2 => "START_PENDING",
-            3 => "STOP_PENDING",
-            4 => "RUNNING",
-            5 => "CONTINUE_PENDING",
-            6 => "PAUSE_PENDING",
-            7 => "PAUSED",
-            _ => "UNKNOWN",
-        };
-    }
-
-    foreach (var state in new[]
-    {
-        "STOPPED",
-        "START_PENDING",
-        "STOP_PENDING",
-        "RUNNING",
-        "CONTINUE_PENDING",
-        "PAUSE_PENDING",
-        "PAUSED",
-    })
+    return stateCode switch
     {
-        if (output.Contains(state, StringComparison.OrdinalIgnoreCase))
-        {
-            return state;
-        }
-    }
-
-    return "UNKNOWN";
+        1 => "STOPPED",
+        2 => "START_PENDING",
+        3 => "STOP_PENDING",
+        4 => "RUNNING",
+        5 => "CONTINUE_PENDING",
+        6 => "PAUSE_PENDING",
+        7 => "PAUSED",
+        _ => "UNKNOWN",
+    };
 }
 
 static bool IsStoppedState(string state)
@@ -2186,7 +2113,7 @@ static async Task<int> InstallAgentBinaryAsync(string version, string downloadUr
             return 21;
         }
 
-        using var http = CreateGitHubClient();
+        var http = GitHubHttp.Client;
         await DownloadFileAsync(http, downloadUrl, zipPath, 250L * 1024 * 1024);
 
         ZipFile.ExtractToDirectory(zipPath, extractDir, overwriteFiles: true);
@@ -2229,7 +2156,7 @@ static async Task<int> InstallAgentBinaryAsync(string version, string downloadUr
 
 static async Task<AgentRelease?> FetchLatestAgentReleaseAsync()
 {
-    using var http = CreateGitHubClient();
+    var http = GitHubHttp.Client;
     await using var stream = await http.GetStreamAsync($"https://api.github.com/repos/{agentRepo}/releases/latest");
     using var document = await JsonDocument.ParseAsync(stream);
     return ParseAgentRelease(document.RootElement);
@@ -2239,7 +2166,7 @@ static async Task<int> InstallManagerVersionAsync(string tag)
 {
     try
     {
-        using var http = CreateGitHubClient();
+        var http = GitHubHttp.Client;
         var releaseUrl = $"https://api.github.com/repos/{managerRepo}/releases/tags/{Uri.EscapeDataString(tag)}";
         await using var releaseStream = await http.GetStreamAsync(releaseUrl);
         using var release = await JsonDocument.ParseAsync(releaseStream);
@@ -2270,7 +2197,7 @@ static async Task<int> InstallManagerVersionAsync(string tag)
             "-ArgumentList @('/VERYSILENT','/SUPPRESSMSGBOXES','/NORESTART','/CLOSEAPPLICATIONS')";
         Process.Start(new ProcessStartInfo
         {
-            FileName = Path.Combine(Environment.SystemDirectory, "WindowsPowerShell", "v1.0", "powershell.exe"),
+            FileName = PowerShellPath(),
             UseShellExecute = false,
             CreateNoWindow = true,
             ArgumentList =
@@ -2453,7 +2380,7 @@ static async Task DownloadFileAsync(HttpClient http, string url, string path, lo
 static bool VerifyManagerInstallerChecksum(string installerPath, string checksumPath)
 {
     var expected = File.ReadLines(checksumPath)
-        .Select(static line => Regex.Match(line, @"^\s*([a-fA-F0-9]{64})\s+\*?BeszelAgentManagerSetup\.exe\s*$"))
+        .Select(static line => HelperRegex.InstallerChecksumLine().Match(line))
         .FirstOrDefault(static match => match.Success)?
         .Groups[1].Value;
     if (string.IsNullOrWhiteSpace(expected))
@@ -2470,7 +2397,7 @@ static async Task<bool> VerifyManagerInstallerSignatureAsync(string installerPat
 {
     var escapedPath = installerPath.Replace("'", "''", StringComparison.Ordinal);
     var result = await RunProcessAsync(
-        Path.Combine(Environment.SystemDirectory, "WindowsPowerShell", "v1.0", "powershell.exe"),
+        PowerShellPath(),
         [
             "-NoProfile",
             "-NonInteractive",
@@ -2486,7 +2413,7 @@ static async Task<bool> VerifyManagerInstallerSignatureAsync(string installerPat
 static async Task<AgentRelease?> FetchAgentReleaseAsync(string version)
 {
     var normalized = NormalizeVersion(version);
-    using var http = CreateGitHubClient();
+    var http = GitHubHttp.Client;
     await using var stream = await http.GetStreamAsync($"https://api.github.com/repos/{agentRepo}/releases?per_page=100");
     using var document = await JsonDocument.ParseAsync(stream);
     if (document.RootElement.ValueKind != JsonValueKind.Array)
@@ -2548,13 +2475,6 @@ static AgentRelease? ParseAgentRelease(JsonElement release)
     return null;
 }
 
-static HttpClient CreateGitHubClient()
-{
-    var http = new HttpClient();
-    http.DefaultRequestHeaders.UserAgent.Add(new ProductInfoHeaderValue("BeszelAgentManager", "4.0.0"));
-    return http;
-}
-
 static string NormalizeVersion(string? value)
 {
     if (string.IsNullOrWhiteSpace(value))
@@ -2568,7 +2488,7 @@ static string NormalizeVersion(string? value)
         trimmed = trimmed[1..].Trim();
     }
 
-    var match = Regex.Match(trimmed, @"\d+\.\d+\.\d+");
+    var match = HelperRegex.SemVer().Match(trimmed);
     return match.Success ? match.Value : trimmed;
 }
 
@@ -2710,13 +2630,39 @@ static string UniqueDailyAgentLogPath(string logDir, DateTime day)
     return Path.Combine(logDir, $"{day:yyyy-MM-dd}_{DateTime.Now:HHmmss}.txt");
 }
 
-static async Task<int> RunScAsync(string command, string name)
+static Task<int> ControlServiceAsync(string command, string name)
 {
-    var result = await RunProcessAsync("sc.exe", [command, name]);
-    return result.ExitCode;
+    return Task.Run(() =>
+    {
+        try
+        {
+            using var controller = new ServiceController(name);
+            if (string.Equals(command, "start", StringComparison.OrdinalIgnoreCase))
+            {
+                controller.Start();
+            }
+            else
+            {
+                controller.Stop(stopDependentServices: false);
+            }
+
+            return 0;
+        }
+        catch (InvalidOperationException ex) when (ex.InnerException is System.ComponentModel.Win32Exception win32)
+        {
+            return win32.NativeErrorCode;
+        }
+        catch (InvalidOperationException)
+        {
+            return 1;
+        }
+    });
 }
 
-static async Task<(int ExitCode, string Output)> RunProcessAsync(string fileName, string[] arguments)
+static async Task<(int ExitCode, string Output)> RunProcessAsync(
+    string fileName,
+    string[] arguments,
+    IReadOnlyDictionary<string, string>? environment = null)
 {
     if (!Path.IsPathRooted(fileName))
     {
@@ -2742,6 +2688,14 @@ static async Task<(int ExitCode, string Output)> RunProcessAsync(string fileName
         startInfo.ArgumentList.Add(argument);
     }
 
+    if (environment is not null)
+    {
+        foreach (var (name, value) in environment)
+        {
+            startInfo.Environment[name] = value;
+        }
+    }
+
     using var process = Process.Start(startInfo);
     if (process is null)
     {
@@ -2828,6 +2782,162 @@ internal static class BrokerRuntime
     }
 }
 
+internal static class AgentEnvironmentKeys
+{
+    public static IReadOnlyDictionary<string, string> ConfigNames { get; } = new Dictionary<string, string>(StringComparer.OrdinalIgnoreCase)
+    {
+        ["DATA_DIR"] = "data_dir",
+        ["DOCKER_HOST"] = "docker_host",
+        ["EXCLUDE_CONTAINERS"] = "exclude_containers",
+        ["EXCLUDE_SMART"] = "exclude_smart",
+        ["EXTRA_FILESYSTEMS"] = "extra_filesystems",
+        ["FILESYSTEM"] = "filesystem",
+        ["INTEL_GPU_DEVICE"] = "intel_gpu_device",
+        ["NVML"] = "nvml",
+        ["KEY_FILE"] = "key_file",
+        ["TOKEN_FILE"] = "token_file",
+        ["LHM"] = "lhm",
+        ["LOG_LEVEL"] = "log_level",
+        ["MEM_CALC"] = "mem_calc",
+        ["NETWORK"] = "network",
+        ["NICS"] = "nics",
+        ["SENSORS"] = "sensors",
+        ["SENSORS_TIMEOUT"] = "sensors_timeout",
+        ["PRIMARY_SENSOR"] = "primary_sensor",
+        ["SYS_SENSORS"] = "sys_sensors",
+        ["SERVICE_PATTERNS"] = "service_patterns",
+        ["SMART_DEVICES"] = "smart_devices",
+        ["SMART_INTERVAL"] = "smart_interval",
+        ["SYSTEM_NAME"] = "system_name",
+        ["SKIP_GPU"] = "skip_gpu",
+        ["GPU_COLLECTOR"] = "gpu_collector",
+        ["DISABLE_SSH"] = "disable_ssh",
+        ["DISK_USAGE_CACHE"] = "disk_usage_cache",
+        ["SKIP_SYSTEMD"] = "skip_systemd",
+    };
+}
+
+internal static class ServiceNative
+{
+    private const int ScManagerConnect = 0x0001;
+    private const int ServiceQueryStatus = 0x0004;
+    private const int ScStatusProcessInfo = 0;
+    private const int ErrorServiceDoesNotExist = 1060;
+
+    public static (int State, int ProcessId)? QueryStatus(string serviceName)
+    {
+        using var manager = OpenSCManager(null, null, ScManagerConnect);
+        if (manager.IsInvalid)
+        {
+            throw new System.ComponentModel.Win32Exception();
+        }
+
+        using var service = OpenService(manager, serviceName, ServiceQueryStatus);
+        if (service.IsInvalid)
+        {
+            var error = Marshal.GetLastWin32Error();
+            return error == ErrorServiceDoesNotExist
+                ? null
+                : throw new System.ComponentModel.Win32Exception(error);
+        }
+
+        if (!QueryServiceStatusEx(
+                service,
+                ScStatusProcessInfo,
+                out var status,
+                Marshal.SizeOf<ServiceStatusProcess>(),
+                out _))
+        {
+            throw new System.ComponentModel.Win32Exception();
+        }
+
+        return (status.CurrentState, status.ProcessId);
+    }
+
+    [DllImport("advapi32.dll", EntryPoint = "OpenSCManagerW", CharSet = CharSet.Unicode, SetLastError = true)]
+    private static extern ServiceHandle OpenSCManager(string? machineName, string? databaseName, int desiredAccess);
+
+    [DllImport("advapi32.dll", EntryPoint = "OpenServiceW", CharSet = CharSet.Unicode, SetLastError = true)]
+    private static extern ServiceHandle OpenService(ServiceHandle manager, string serviceName, int desiredAccess);
+
+    [DllImport("advapi32.dll", SetLastError = true)]
+    [return: MarshalAs(UnmanagedType.Bool)]
+    private static extern bool QueryServiceStatusEx(
+        ServiceHandle service,
+        int infoLevel,
+        out ServiceStatusProcess buffer,
+        int bufferSize,
+        out int bytesNeeded);
+
+    [DllImport("advapi32.dll", SetLastError = true)]
+    [return: MarshalAs(UnmanagedType.Bool)]
+    private static extern bool CloseServiceHandle(IntPtr handle);
+
+    private sealed class ServiceHandle : Microsoft.Win32.SafeHandles.SafeHandleZeroOrMinusOneIsInvalid
+    {
+        public ServiceHandle()
+            : base(ownsHandle: true)
+        {
+        }
+
+        protected override bool ReleaseHandle()
+        {
+            return CloseServiceHandle(handle);
+        }
+    }
+
+    [StructLayout(LayoutKind.Sequential)]
+    private struct ServiceStatusProcess
+    {
+        public int ServiceType;
+        public int CurrentState;
+        public int ControlsAccepted;
+        public int Win32ExitCode;
+        public int ServiceSpecificExitCode;
+        public int CheckPoint;
+        public int WaitHint;
+        public int ProcessId;
+        public int ServiceFlags;
+    }
+}
+
+internal static class GitHubHttp
+{
+    public static HttpClient Client { get; } = CreateClient();
+
+    private static HttpClient CreateClient()
+    {
+        var http = new HttpClient(new SocketsHttpHandler
+        {
+            PooledConnectionLifetime = TimeSpan.FromMinutes(15),
+            PooledConnectionIdleTimeout = TimeSpan.FromMinutes(2),
+        });
+        http.DefaultRequestHeaders.UserAgent.Add(new ProductInfoHeaderValue("BeszelAgentManager", "4.0.0"));
+        return http;
+    }
+}
+
+internal static partial class HelperRegex
+{
+    [GeneratedRegex(@"\d+\.\d+\.\d+")]
+    public static partial Regex SemVer();
+
+    [GeneratedRegex(@"^\d+\.\d+\.\d+(?:[-+][0-9A-Za-z.-]+)?$")]
+    public static partial Regex InstalledVersion();
+
+    [GeneratedRegex(@"^v?\d+\.\d+\.\d+$", RegexOptions.CultureInvariant)]
+    public static partial Regex AgentVersionArgument();
+
+    [GeneratedRegex(@"^v?\d+\.\d+\.\d+(?:-rc\d+)?$", RegexOptions.IgnoreCase | RegexOptions.CultureInvariant)]
+    public static partial Regex ManagerTagArgument();
+
+    [GeneratedRegex(@"^[A-Za-z_][A-Za-z0-9_]*$", RegexOptions.CultureInvariant)]
+    public static partial Regex EnvironmentName();
+
+    [GeneratedRegex(@"^\s*([a-fA-F0-9]{64})\s+\*?BeszelAgentManagerSetup\.exe\s*$")]
+    public static partial Regex InstallerChecksumLine();
+}
+
 internal sealed class BackgroundRuntimeState
 {
     public int AgentUpdateIntervalHours { get; set; } = 24;
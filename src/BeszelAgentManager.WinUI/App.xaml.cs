@@ -1,10 +1,5 @@
 ﻿using Microsoft.UI.Xaml;
 using BeszelAgentManager.WinUI.Services;
-using Microsoft.UI.Xaml.Controls;
-using Microsoft.UI.Xaml.Data;
-using Microsoft.UI.Xaml.Input;
-using Microsoft.UI.Xaml.Media;
-using Microsoft.UI.Xaml.Navigation;
 using Microsoft.Windows.AppLifecycle;
 
 // To learn more about WinUI, the WinUI project structure,
@@ -69,6 +64,6 @@ public partial class App : Application
 
     private void MainInstance_Activated(object? sender, AppActivationArguments args)
     {
-        MainWindow?.DispatcherQueue.TryEnqueue(MainWindow.ShowFromTray);
+        MainWindow?.ShowFromTray();
     }
 }
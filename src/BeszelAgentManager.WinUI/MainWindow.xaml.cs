@@ -13,20 +13,31 @@ namespace BeszelAgentManager.WinUI;
 
 public sealed partial class MainWindow : Window
 {
+    private const string AgentFilesMissingMessage = "The agent or configuration file could not be found.";
+    private const string NssmMissingMessage = "NSSM could not be found. Reinstall BeszelAgentManager or place nssm.exe next to the installed app.";
+    private const int ReleaseNotesPreviewLines = 18;
+    private static readonly TimeSpan HubStatusInterval = TimeSpan.FromSeconds(15);
+    private static readonly TimeSpan MaxHubStatusInterval = TimeSpan.FromMinutes(5);
+    private static readonly TimeSpan MinServiceStatusInterval = TimeSpan.FromSeconds(1);
     private readonly SystemStatusService _systemStatusService = new();
-    private readonly ManagerUpdateService _managerUpdateService = new();
-    private readonly AgentReleaseService _agentReleaseService = new();
+    private ManagerUpdateService? _managerUpdateService;
+    private AgentReleaseService? _agentReleaseService;
+    private AgentVersionDialog? _agentVersionDialog;
     private readonly ConfigService _configService = new();
     private readonly HubStatusService _hubStatusService = new();
     private readonly TrayIconService _trayIconService;
     private readonly DispatcherQueueTimer _hubStatusTimer;
     private readonly DispatcherQueueTimer _serviceStatusTimer;
-    private readonly DispatcherQueueTimer _globalNotificationTimer;
+    private DispatcherQueueTimer? _globalNotificationTimer;
     private readonly DispatcherQueueTimer _managerUpdateTimer;
     private string _hubUrl = string.Empty;
-    private bool _refreshingServiceStatus;
+    private Task? _serviceStatusRefresh;
+    private bool _serviceStatusRefreshQueued;
+    private long _serviceStatusRefreshedAt;
+    private bool _refreshingHubStatus;
     private string _lastServiceState = string.Empty;
     private string _lastHubState = string.Empty;
+    private (string ServiceState, string AgentVersion) _headerStatus;
     private bool _exitRequested;
     private bool _managerUpdateAvailable;
     private bool _checkingManagerUpdate;
@@ -35,6 +46,10 @@ public sealed partial class MainWindow : Window
     private bool _showAfterHiddenPrewarm;
     private PointInt32 _prewarmOriginalPosition;
 
+    private ManagerUpdateService ManagerUpdates => _managerUpdateService ??= new();
+
+    private AgentReleaseService AgentReleases => _agentReleaseService ??= new();
+
     public MainWindow()
     {
         InitializeComponent();
@@ -59,15 +74,18 @@ public sealed partial class MainWindow : Window
             () => RunTrayServiceActionAsync("restart", "Restart service"),
             RunTrayAgentUpdateAsync,
             ExitFromTray);
+        DispatcherQueue.TryEnqueue(DispatcherQueuePriority.Low, _trayIconService.Create);
         AppWindow.Closing += AppWindow_Closing;
         Closed += (_, _) => _trayIconService.Dispose();
 
-        VersionBadgeText.Text = $"v{AppInfo.Version}";
+        VersionBadgeButton.Content = $"v{AppInfo.Version}";
+        VersionBadgeButton.Tag = $"https://github.com/{AppInfo.ManagerRepo}/releases";
+        AboutLink.Tag = $"https://github.com/{AppInfo.ManagerRepo}";
         NavFrame.Navigate(typeof(ConnectionPage));
         _ = RefreshStatusAsync();
 
         _hubStatusTimer = DispatcherQueue.CreateTimer();
-        _hubStatusTimer.Interval = TimeSpan.FromSeconds(15);
+        _hubStatusTimer.Interval = HubStatusInterval;
         _hubStatusTimer.Tick += async (_, _) => await RefreshHubStatusAsync();
         _hubStatusTimer.Start();
 
@@ -76,15 +94,6 @@ public sealed partial class MainWindow : Window
         _serviceStatusTimer.Tick += async (_, _) => await RefreshServiceStatusAsync();
         _serviceStatusTimer.Start();
 
-        _globalNotificationTimer = DispatcherQueue.CreateTimer();
-        _globalNotificationTimer.Interval = TimeSpan.FromSeconds(10);
-        _globalNotificationTimer.Tick += (_, _) =>
-        {
-            _globalNotificationTimer.Stop();
-            GlobalActionInfoBar.IsOpen = false;
-            GlobalActionInfoBar.Visibility = Visibility.Collapsed;
-        };
-
         _managerUpdateTimer = DispatcherQueue.CreateTimer();
         _managerUpdateTimer.Interval = TimeSpan.FromMinutes(15);
         _managerUpdateTimer.Tick += async (_, _) => await CheckManagerUpdateInBackgroundAsync();
@@ -115,7 +124,7 @@ public sealed partial class MainWindow : Window
 
     public void ShowFromTray()
     {
-        DispatcherQueue.TryEnqueue(() =>
+        RunOnUiThread(() =>
         {
             if (!_firstFrameRendered)
             {
@@ -129,6 +138,17 @@ public sealed partial class MainWindow : Window
         });
     }
 
+    private void RunOnUiThread(DispatcherQueueHandler action)
+    {
+        if (DispatcherQueue.HasThreadAccess)
+        {
+            action();
+            return;
+        }
+
+        DispatcherQueue.TryEnqueue(action);
+    }
+
     public void ShowInitialWindow()
     {
         if (_firstFrameRendered)
@@ -210,7 +230,7 @@ public sealed partial class MainWindow : Window
 
     private void OpenHubFromTray()
     {
-        DispatcherQueue.TryEnqueue(() =>
+        RunOnUiThread(() =>
         {
             if (string.IsNullOrWhiteSpace(_hubUrl))
             {
@@ -269,7 +289,7 @@ public sealed partial class MainWindow : Window
                 return;
             }
 
-            var latest = (await _agentReleaseService.FetchStableReleasesAsync()).FirstOrDefault();
+            var latest = (await AgentReleases.FetchStableReleasesAsync()).FirstOrDefault();
             if (latest is not null
                 && !string.Equals(status.AgentVersion, "Unknown", StringComparison.OrdinalIgnoreCase)
                 && VersionComparer.IsSameOrOlder(status.AgentVersion, latest.Version))
@@ -331,29 +351,39 @@ public sealed partial class MainWindow : Window
         {
             case "connection":
                 App.Logger.Debug("Opened Connection tab");
-                NavFrame.Navigate(typeof(ConnectionPage));
+                NavigateTo(typeof(ConnectionPage));
                 break;
             case "environment":
                 App.Logger.Debug("Opened Environment Tables tab");
-                NavFrame.Navigate(typeof(EnvironmentPage));
+                NavigateTo(typeof(EnvironmentPage));
                 break;
             case "logging":
                 App.Logger.Debug("Opened Logging tab");
-                NavFrame.Navigate(typeof(LogsPage));
+                NavigateTo(typeof(LogsPage));
                 break;
             case "agentLogging":
                 App.Logger.Debug("Opened Agent Logging tab");
-                NavFrame.Navigate(typeof(AgentLoggingPage));
+                NavigateTo(typeof(AgentLoggingPage));
                 break;
             case "extra":
                 App.Logger.Debug("Opened Extra tab");
-                NavFrame.Navigate(typeof(ExtraPage));
+                NavigateTo(typeof(ExtraPage));
                 break;
             default:
                 throw new InvalidOperationException($"Unknown navigation item tag: {item.Tag}");
         }
     }
 
+    private void NavigateTo(Type pageType)
+    {
+        if (NavFrame.Content?.GetType() == pageType)
+        {
+            return;
+        }
+
+        NavFrame.Navigate(pageType);
+    }
+
     public async Task RefreshStatusAsync()
     {
         await RefreshServiceStatusAsync();
@@ -362,22 +392,39 @@ public sealed partial class MainWindow : Window
 
     public Task RefreshServiceStatusNowAsync()
     {
-        return RefreshServiceStatusAsync();
+        return RefreshServiceStatusAsync(force: true);
     }
 
-    private async Task RefreshServiceStatusAsync()
+    private Task RefreshServiceStatusAsync(bool force = false)
     {
-        if (_refreshingServiceStatus)
+        if (_serviceStatusRefresh is { IsCompleted: false } running)
         {
-            return;
+            _serviceStatusRefreshQueued |= force;
+            return running;
         }
 
-        _refreshingServiceStatus = true;
-        try
+        if (!force && Environment.TickCount64 - _serviceStatusRefreshedAt < MinServiceStatusInterval.TotalMilliseconds)
         {
+            return Task.CompletedTask;
+        }
+
+        _serviceStatusRefresh = RefreshServiceStatusCoreAsync();
+        return _serviceStatusRefresh;
+    }
+
+    private async Task RefreshServiceStatusCoreAsync()
+    {
+        do
+        {
+            _serviceStatusRefreshQueued = false;
             var status = await _systemStatusService.GetAgentStatusAsync();
-            HeaderServiceText.Text = $"Service: {status.ServiceState}";
-            HeaderAgentText.Text = $"Agent: {status.AgentVersion}";
+            if (_headerStatus != (status.ServiceState, status.AgentVersion))
+            {
+                HeaderServiceRun.Text = $"Service: {status.ServiceState}";
+                HeaderAgentRun.Text = $"Agent: {status.AgentVersion}";
+                _headerStatus = (status.ServiceState, status.AgentVersion);
+            }
+
             if (NavFrame.Content is ConnectionPage connectionPage)
             {
                 connectionPage.ApplyServiceStatus(status);
@@ -388,11 +435,10 @@ public sealed partial class MainWindow : Window
                 App.Logger.Debug($"Service status changed: {_lastServiceState} -> {status.ServiceState}");
                 _lastServiceState = status.ServiceState;
             }
+
+            _serviceStatusRefreshedAt = Environment.TickCount64;
         }
-        finally
-        {
-            _refreshingServiceStatus = false;
-        }
+        while (_serviceStatusRefreshQueued);
     }
 
     private async Task CheckManagerUpdateInBackgroundAsync()
@@ -419,7 +465,7 @@ public sealed partial class MainWindow : Window
                 return;
             }
 
-            var release = await _managerUpdateService.FetchLatestReleaseAsync(config.ManagerUpdateIncludePrereleases);
+            var release = await ManagerUpdates.FetchLatestReleaseAsync(config.ManagerUpdateIncludePrereleases);
             config.ManagerUpdateLastCheckAt = DateTimeOffset.Now.ToString("O");
             _managerUpdateAvailable = release is not null
                 && !VersionComparer.IsSameOrOlder(AppInfo.Version, release.Version)
@@ -452,32 +498,52 @@ public sealed partial class MainWindow : Window
 
     private async Task RefreshHubStatusAsync()
     {
-        var config = await _configService.LoadAsync();
-        var fallbackActive = IsHubFallbackActive()
-            && config.HubUrlIpFallbackEnabled
-            && !string.IsNullOrWhiteSpace(config.HubUrlIpFallback);
-        var status = await _hubStatusService.CheckAsync(fallbackActive ? config.HubUrlIpFallback : config.HubUrl);
+        if (_refreshingHubStatus)
+        {
+            return;
+        }
+
+        _refreshingHubStatus = true;
+        HubStatus status;
+        bool fallbackActive;
+        try
+        {
+            var config = await _configService.LoadAsync();
+            fallbackActive = IsHubFallbackActive()
+                && config.HubUrlIpFallbackEnabled
+                && !string.IsNullOrWhiteSpace(config.HubUrlIpFallback);
+            status = await _hubStatusService.CheckAsync(fallbackActive ? config.HubUrlIpFallback : config.HubUrl);
+        }
+        finally
+        {
+            _refreshingHubStatus = false;
+        }
+
         _hubUrl = status.Url;
+        _hubStatusTimer.Interval = status.IsConfigured && !status.IsReachable
+            ? TimeSpan.FromTicks(Math.Min(_hubStatusTimer.Interval.Ticks * 2, MaxHubStatusInterval.Ticks))
+            : HubStatusInterval;
 
+        string hubState;
         if (!status.IsConfigured)
         {
-            HubStatusLink.Content = "Hub: Not configured";
+            hubState = "Hub: Not configured";
         }
         else if (status.IsReachable)
         {
-            HubStatusLink.Content = fallbackActive
+            hubState = fallbackActive
                 ? $"Hub: Fallback reachable ({status.LatencyMilliseconds} ms)"
                 : $"Hub: Reachable ({status.LatencyMilliseconds} ms)";
         }
         else
         {
-            HubStatusLink.Content = fallbackActive ? "Hub: Fallback unreachable" : "Hub: Unreachable";
+            hubState = fallbackActive ? "Hub: Fallback unreachable" : "Hub: Unreachable";
         }
 
-        var hubState = HubStatusLink.Content?.ToString() ?? string.Empty;
         if (!string.Equals(_lastHubState, hubState, StringComparison.Ordinal))
         {
             App.Logger.Debug($"Hub status changed: {hubState}");
+            HubStatusLink.Content = hubState;
             _lastHubState = hubState;
         }
     }
@@ -493,7 +559,7 @@ public sealed partial class MainWindow : Window
             var config = await _configService.LoadAsync();
             var includePrereleases = config.ExtraFields.TryGetValue("manager_update_include_prereleases", out var includeValue)
                 && includeValue.ValueKind is System.Text.Json.JsonValueKind.True;
-            var release = await _managerUpdateService.FetchLatestReleaseAsync(includePrereleases);
+            var release = await ManagerUpdates.FetchLatestReleaseAsync(includePrereleases, forceRevalidate: true);
 
             if (release is null)
             {
@@ -591,7 +657,7 @@ public sealed partial class MainWindow : Window
                 return;
             }
 
-            var latest = (await _agentReleaseService.FetchStableReleasesAsync()).FirstOrDefault();
+            var latest = (await AgentReleases.FetchStableReleasesAsync()).FirstOrDefault();
             if (latest is null)
             {
                 ShowGlobalStatus(
@@ -686,7 +752,7 @@ public sealed partial class MainWindow : Window
 
         try
         {
-            var releases = await _agentReleaseService.FetchStableReleasesAsync();
+            var releases = await AgentReleases.FetchStableReleasesAsync();
             if (releases.Count == 0)
             {
                 ShowGlobalStatus(
@@ -696,48 +762,16 @@ public sealed partial class MainWindow : Window
                 return;
             }
 
-            var picker = new ComboBox
-            {
-                HorizontalAlignment = HorizontalAlignment.Stretch,
-                ItemsSource = releases.Select(static release => $"{release.Version} ({release.Tag})").ToList(),
-                SelectedIndex = 0,
-            };
-            var notes = new TextBlock
-            {
-                Text = BuildReleaseNotesPreview(releases[0].Body),
-                TextWrapping = TextWrapping.Wrap,
-                MaxHeight = 260,
-            };
-            picker.SelectionChanged += (_, _) =>
-            {
-                if (picker.SelectedIndex >= 0 && picker.SelectedIndex < releases.Count)
-                {
-                    notes.Text = BuildReleaseNotesPreview(releases[picker.SelectedIndex].Body);
-                }
-            };
+            _agentVersionDialog ??= new AgentVersionDialog();
+            _agentVersionDialog.Bind(releases);
+            _agentVersionDialog.Dialog.XamlRoot = NavView.XamlRoot;
 
-            var panel = new StackPanel { Spacing = 10 };
-            panel.Children.Add(new TextBlock { Text = "Select agent version:", TextWrapping = TextWrapping.Wrap });
-            panel.Children.Add(picker);
-            panel.Children.Add(notes);
-
-            var dialog = new ContentDialog
-            {
-                XamlRoot = NavView.XamlRoot,
-                Title = "Manage Agent Version",
-                Content = panel,
-                PrimaryButtonText = "Install",
-                CloseButtonText = "Cancel",
-                DefaultButton = ContentDialogButton.Primary,
-            };
-
-            var result = await dialog.ShowAsync();
-            if (result != ContentDialogResult.Primary || picker.SelectedIndex < 0)
+            var result = await _agentVersionDialog.Dialog.ShowAsync();
+            if (result != ContentDialogResult.Primary || _agentVersionDialog.SelectedRelease is not { } selected)
             {
                 return;
             }
 
-            var selected = releases[picker.SelectedIndex];
             await RunAgentOperationAsync(
                 ManageAgentVersionButton,
                 "Installing...",
@@ -937,9 +971,9 @@ public sealed partial class MainWindow : Window
 
         return exitCode switch
         {
-            3 => "The agent or configuration file could not be found.",
+            3 => AgentFilesMissingMessage,
             4 => "The background service could not apply the Beszel Agent service configuration.",
-            53 => "NSSM could not be found. Reinstall BeszelAgentManager or place nssm.exe next to the installed app.",
+            53 => NssmMissingMessage,
             _ => $"The background service returned exit code {exitCode}.",
         };
     }
@@ -1054,17 +1088,17 @@ public sealed partial class MainWindow : Window
     {
         return exitCode switch
         {
-            3 => "The agent or configuration file could not be found.",
+            3 => AgentFilesMissingMessage,
             20 => "Could not find a usable Beszel Agent release on GitHub.",
             21 => "The downloaded archive did not contain beszel-agent.exe.",
             22 => "The agent could not be downloaded or installed. Check the log and antivirus quarantine.",
             23 => "One or more agent folders could not be removed. Stop the service and close any open agent logs or folders, then try again.",
-            53 => "NSSM could not be found. Reinstall BeszelAgentManager or place nssm.exe next to the installed app.",
+            53 => NssmMissingMessage,
             _ => $"The background service returned error code {exitCode}.",
         };
     }
 
-    private static string BuildReleaseNotesPreview(string body)
+    private static string ReleaseNotesText(string? body, int maxLines = int.MaxValue)
     {
         if (string.IsNullOrWhiteSpace(body))
         {
@@ -1080,9 +1114,9 @@ public sealed partial class MainWindow : Window
             lines.RemoveAt(lines.Count - 1);
         }
 
-        if (lines.Count > 18)
+        if (lines.Count > maxLines)
         {
-            lines = lines.Take(18).Append("...").Append("(truncated)").ToList();
+            lines = lines.Take(maxLines).Append("...").Append("(truncated)").ToList();
         }
 
         return string.Join(Environment.NewLine, lines);
@@ -1094,7 +1128,7 @@ public sealed partial class MainWindow : Window
         try
         {
             var config = await _configService.LoadAsync();
-            var releases = await _managerUpdateService.FetchReleasesAsync(config.ManagerUpdateIncludePrereleases);
+            var releases = await ManagerUpdates.FetchReleasesAsync(config.ManagerUpdateIncludePrereleases, forceRevalidate: true);
             if (releases.Count == 0)
             {
                 ShowGlobalStatus(InfoBarSeverity.Warning, "No manager versions found", "No usable installer releases were returned by GitHub.");
@@ -1107,16 +1141,18 @@ public sealed partial class MainWindow : Window
                 SelectedIndex = 0,
                 HorizontalAlignment = HorizontalAlignment.Stretch,
             };
+            var noteTexts = new string?[releases.Count];
             var notes = new TextBlock
             {
-                Text = FullReleaseNotes(releases[0].Body),
+                Text = noteTexts[0] = ReleaseNotesText(releases[0].Body),
                 TextWrapping = TextWrapping.Wrap,
             };
             picker.SelectionChanged += (_, _) =>
             {
-                if (picker.SelectedIndex >= 0)
+                var index = picker.SelectedIndex;
+                if (index >= 0)
                 {
-                    notes.Text = FullReleaseNotes(releases[picker.SelectedIndex].Body);
+                    notes.Text = noteTexts[index] ??= ReleaseNotesText(releases[index].Body);
                 }
             };
 
@@ -1233,6 +1269,7 @@ public sealed partial class MainWindow : Window
             return;
         }
 
+        var before = ManagerUpdateSettingsSnapshot(config);
         config.ManagerUpdateNotifyEnabled = notify.IsChecked == true;
         config.ManagerUpdateTrayBadgeEnabled = badge.IsChecked == true;
         config.ManagerUpdateIncludePrereleases = prereleases.IsChecked == true;
@@ -1240,6 +1277,12 @@ public sealed partial class MainWindow : Window
             ? 6
             : Math.Clamp((int)interval.Value, 1, 168);
         config.ManagerUpdateSkipVersion = skipVersion.Text.Trim();
+        if (before == ManagerUpdateSettingsSnapshot(config))
+        {
+            ShowGlobalStatus(InfoBarSeverity.Informational, "No changes to save", "The manager update settings were not changed.");
+            return;
+        }
+
         config.ManagerUpdateLastCheckAt = string.Empty;
         await _configService.SaveAsync(config);
         App.Logger.Info("Manager update settings saved");
@@ -1247,9 +1290,14 @@ public sealed partial class MainWindow : Window
         _ = CheckManagerUpdateInBackgroundAsync();
     }
 
-    private static string FullReleaseNotes(string? body)
+    private static (bool Notify, bool TrayBadge, bool IncludePrereleases, int IntervalHours, string SkipVersion) ManagerUpdateSettingsSnapshot(AgentConfig config)
     {
-        return string.IsNullOrWhiteSpace(body) ? "(No release notes.)" : body.Trim();
+        return (
+            config.ManagerUpdateNotifyEnabled,
+            config.ManagerUpdateTrayBadgeEnabled,
+            config.ManagerUpdateIncludePrereleases,
+            config.ManagerUpdateCheckIntervalHours,
+            config.ManagerUpdateSkipVersion);
     }
 
     private async Task InstallManagerReleaseAsync(ManagerRelease release)
@@ -1308,7 +1356,7 @@ public sealed partial class MainWindow : Window
         var executable = (Environment.ProcessPath ?? Path.Combine(AppContext.BaseDirectory, "BeszelAgentManager.exe")).Replace("'", "''", StringComparison.Ordinal);
         var script = $$"""
             $deadline = (Get-Date).AddMinutes(15)
-            while (Get-Process -Id {{Environment.ProcessId}} -ErrorAction SilentlyContinue) { Start-Sleep -Seconds 1 }
+            Wait-Process -Id {{Environment.ProcessId}} -ErrorAction SilentlyContinue
             Start-Sleep -Seconds 8
             while ((Get-Date) -lt $deadline) {
               if (Test-Path -LiteralPath '{{executable}}') {
@@ -1333,10 +1381,13 @@ public sealed partial class MainWindow : Window
         }) ?? throw new InvalidOperationException("Could not start the manager update relauncher.");
     }
 
-    private void VersionBadgeButton_Click(object sender, RoutedEventArgs e)
+    private void ExternalLink_Click(object sender, RoutedEventArgs e)
     {
-        App.Logger.Info("Opening manager release link");
-        OpenUrl($"https://github.com/{AppInfo.ManagerRepo}/releases");
+        if (sender is FrameworkElement { Tag: string url })
+        {
+            App.Logger.Info($"Opening link: {url}");
+            OpenUrl(url);
+        }
     }
 
     private void HubStatusLink_Click(object sender, RoutedEventArgs e)
@@ -1348,18 +1399,6 @@ public sealed partial class MainWindow : Window
         }
     }
 
-    private void AboutLink_Click(object sender, RoutedEventArgs e)
-    {
-        App.Logger.Info("Opening BeszelAgentManager GitHub page");
-        OpenUrl($"https://github.com/{AppInfo.ManagerRepo}");
-    }
-
-    private void AboutBeszelLink_Click(object sender, RoutedEventArgs e)
-    {
-        App.Logger.Info("Opening Beszel website");
-        OpenUrl("https://beszel.dev");
-    }
-
     private async Task ShowMessageAsync(string title, string message)
     {
         var dialog = new ContentDialog
@@ -1378,6 +1417,23 @@ public sealed partial class MainWindow : Window
 
     private void ShowGlobalStatus(InfoBarSeverity severity, string title, string message)
     {
+        if (GlobalActionInfoBar is null)
+        {
+            (Content as FrameworkElement)?.FindName(nameof(GlobalActionInfoBar));
+        }
+
+        if (_globalNotificationTimer is null)
+        {
+            _globalNotificationTimer = DispatcherQueue.CreateTimer();
+            _globalNotificationTimer.Interval = TimeSpan.FromSeconds(10);
+            _globalNotificationTimer.Tick += (timer, _) =>
+            {
+                timer.Stop();
+                GlobalActionInfoBar.IsOpen = false;
+                GlobalActionInfoBar.Visibility = Visibility.Collapsed;
+            };
+        }
+
         GlobalActionInfoBar.Severity = severity;
         GlobalActionInfoBar.Title = title;
         GlobalActionInfoBar.Message = message;
@@ -1401,7 +1457,8 @@ public sealed partial class MainWindow : Window
                 return false;
             }
 
-            using var document = System.Text.Json.JsonDocument.Parse(File.ReadAllText(ManagerPaths.DnsFallbackStatePath));
+            using var stream = File.OpenRead(ManagerPaths.DnsFallbackStatePath);
+            using var document = System.Text.Json.JsonDocument.Parse(stream);
             return document.RootElement.TryGetProperty("active", out var active)
                 && active.ValueKind == System.Text.Json.JsonValueKind.True;
         }
@@ -1422,12 +1479,9 @@ public sealed partial class MainWindow : Window
 
         if (!string.IsNullOrWhiteSpace(release.Body))
         {
-            var notes = release.Body.Length > 1500
-                ? $"{release.Body[..1500]}\n\n(truncated)"
-                : release.Body;
             panel.Children.Add(new TextBlock
             {
-                Text = notes,
+                Text = ReleaseNotesText(release.Body, ReleaseNotesPreviewLines),
                 TextWrapping = TextWrapping.Wrap,
                 MaxHeight = 300,
             });
@@ -1445,10 +1499,71 @@ public sealed partial class MainWindow : Window
             return;
         }
 
-        System.Diagnostics.Process.Start(new System.Diagnostics.ProcessStartInfo
+        Process.Start(new ProcessStartInfo
         {
             FileName = uri.AbsoluteUri,
             UseShellExecute = true,
         });
     }
+
+    private sealed class AgentVersionDialog
+    {
+        private readonly ComboBox _picker;
+        private readonly TextBlock _notes;
+        private IReadOnlyList<AgentRelease> _releases = [];
+        private string?[] _noteTexts = [];
+
+        public AgentVersionDialog()
+        {
+            _picker = new ComboBox { HorizontalAlignment = HorizontalAlignment.Stretch };
+            _notes = new TextBlock
+            {
+                TextWrapping = TextWrapping.Wrap,
+                MaxHeight = 260,
+            };
+            _picker.SelectionChanged += (_, _) => ShowNotes(_picker.SelectedIndex);
+
+            var panel = new StackPanel { Spacing = 10 };
+            panel.Children.Add(new TextBlock { Text = "Select agent version:", TextWrapping = TextWrapping.Wrap });
+            panel.Children.Add(_picker);
+            panel.Children.Add(_notes);
+
+            Dialog = new ContentDialog
+            {
+                Title = "Manage Agent Version",
+                Content = panel,
+                PrimaryButtonText = "Install",
+                CloseButtonText = "Cancel",
+                DefaultButton = ContentDialogButton.Primary,
+            };
+        }
+
+        public ContentDialog Dialog { get; }
+
+        public AgentRelease? SelectedRelease =>
+            _picker.SelectedIndex >= 0 && _picker.SelectedIndex < _releases.Count
+                ? _releases[_picker.SelectedIndex]
+                : null;
+
+        public void Bind(IReadOnlyList<AgentRelease> releases)
+        {
+            if (!ReferenceEquals(releases, _releases))
+            {
+                _releases = releases;
+                _noteTexts = new string?[releases.Count];
+                _picker.ItemsSource = releases.Select(static release => $"{release.Version} ({release.Tag})").ToList();
+            }
+
+            _picker.SelectedIndex = 0;
+            ShowNotes(0);
+        }
+
+        private void ShowNotes(int index)
+        {
+            if (index >= 0 && index < _releases.Count)
+            {
+                _notes.Text = _noteTexts[index] ??= ReleaseNotesText(_releases[index].Body, ReleaseNotesPreviewLines);
+            }
+        }
+    }
 }
@@ -1,6 +1,5 @@
+using BeszelAgentManager.Core;
 using BeszelAgentManager.WinUI.Services;
-using Microsoft.UI;
-using Microsoft.UI.Xaml.Documents;
 using Microsoft.UI.Xaml;
 using Microsoft.UI.Xaml.Controls;
 using Microsoft.UI.Dispatching;
@@ -10,27 +9,53 @@ namespace BeszelAgentManager.WinUI.Pages;
 
 public sealed partial class AgentLoggingPage : Page
 {
+    private const int CurrentLogTailBytes = 256 * 1024;
+    private const int MaxDisplayLines = 500;
     private readonly LogReaderService _logReader = new();
+    private readonly LogFolderWatcher _logFolderWatcher;
     private readonly DispatcherQueueTimer _refreshTimer;
+    private readonly DispatcherQueueTimer _selectionRefreshTimer;
+    private readonly LogTextView _logView;
     private bool _loadingLogFiles;
     private bool _refreshing;
-    private long _lastFileLength = -1;
-    private DateTime _lastFileWriteUtc = DateTime.MinValue;
 
     public AgentLoggingPage()
     {
         InitializeComponent();
+        _logView = new LogTextView(LogTextBlock, LogScrollViewer, MaxDisplayLines);
+        _logFolderWatcher = new LogFolderWatcher((Path.GetDirectoryName(ManagerPaths.AgentLogPath) ?? ManagerPaths.DataDir, "*"));
+        foreach (var failure in _logFolderWatcher.Failures)
+        {
+            App.Logger.Debug($"Log folder watcher unavailable for {failure}");
+        }
+
         Loaded += AgentLoggingPage_Loaded;
         Unloaded += AgentLoggingPage_Unloaded;
         _refreshTimer = DispatcherQueue.CreateTimer();
         _refreshTimer.Interval = TimeSpan.FromSeconds(2);
         _refreshTimer.Tick += async (_, _) => await RefreshLiveLogAsync();
+        _selectionRefreshTimer = DispatcherQueue.CreateTimer();
+        _selectionRefreshTimer.Interval = TimeSpan.FromMilliseconds(150);
+        _selectionRefreshTimer.IsRepeating = false;
+        _selectionRefreshTimer.Tick += async (_, _) =>
+        {
+            _selectionRefreshTimer.Stop();
+            await RefreshAsync();
+        };
     }
 
     private async void AgentLoggingPage_Loaded(object sender, RoutedEventArgs e)
     {
-        LoadLogFiles();
-        await RefreshAsync();
+        if (_logFolderWatcher.TakeChanges() || !_logFolderWatcher.IsComplete)
+        {
+            await LoadLogFilesAsync();
+        }
+
+        if (!IsDisplayedLogCurrent())
+        {
+            await RefreshAsync();
+        }
+
         App.Logger.Debug("Agent Logging page opened");
         _refreshTimer.Start();
     }
@@ -38,12 +63,13 @@ public sealed partial class AgentLoggingPage : Page
     private void AgentLoggingPage_Unloaded(object sender, RoutedEventArgs e)
     {
         _refreshTimer.Stop();
+        _selectionRefreshTimer.Stop();
     }
 
     private async void RefreshButton_Click(object sender, RoutedEventArgs e)
     {
         App.Logger.Debug("Agent log refresh requested");
-        LoadLogFiles();
+        await LoadLogFilesAsync();
         await RefreshAsync();
     }
 
@@ -70,7 +96,7 @@ public sealed partial class AgentLoggingPage : Page
                 InfoBarSeverity.Success,
                 "Agent log rotated",
                 "The current agent log was archived and a fresh log was started.");
-            LoadLogFiles();
+            await LoadLogFilesAsync();
             await RefreshAsync();
         }
         catch (System.ComponentModel.Win32Exception ex) when (ex.NativeErrorCode == 1223)
@@ -95,11 +121,12 @@ public sealed partial class AgentLoggingPage : Page
         }
     }
 
-    private async void LogSelector_SelectionChanged(object sender, SelectionChangedEventArgs e)
+    private void LogSelector_SelectionChanged(object sender, SelectionChangedEventArgs e)
     {
         if (IsLoaded && !_loadingLogFiles)
         {
-            await RefreshAsync();
+            _selectionRefreshTimer.Stop();
+            _selectionRefreshTimer.Start();
         }
     }
 
@@ -111,21 +138,27 @@ public sealed partial class AgentLoggingPage : Page
         }
     }
 
-    private void LoadLogFiles()
+    private async Task LoadLogFilesAsync()
     {
+        var files = await Task.Run(() => _logReader.ListAgentLogFiles());
         _loadingLogFiles = true;
         var selectedPath = (LogSelector.SelectedItem as LogFileItem)?.Path;
-        var files = _logReader.ListAgentLogFiles();
-        LogSelector.Items.Clear();
-
-        foreach (var file in files)
+        if (LogSelectorMatches(files))
         {
-            LogSelector.Items.Add(file);
+            files = LogSelector.Items.Cast<LogFileItem>().ToList();
+        }
+        else
+        {
+            LogSelector.Items.Clear();
+            foreach (var file in files)
+            {
+                LogSelector.Items.Add(file);
+            }
         }
 
         if (LogSelector.Items.Count == 0)
         {
-            SetLogText("(No agent logs found yet.)");
+            _logView.SetText("(No agent logs found yet.)");
             _loadingLogFiles = false;
             return;
         }
@@ -137,6 +170,24 @@ public sealed partial class AgentLoggingPage : Page
         _loadingLogFiles = false;
     }
 
+    private bool LogSelectorMatches(IReadOnlyList<LogFileItem> files)
+    {
+        if (LogSelector.Items.Count != files.Count)
+        {
+            return false;
+        }
+
+        for (var index = 0; index < files.Count; index++)
+        {
+            if (!Equals(LogSelector.Items[index], files[index]))
+            {
+                return false;
+            }
+        }
+
+        return true;
+    }
+
     private async Task RefreshAsync()
     {
         if (_refreshing)
@@ -151,18 +202,19 @@ public sealed partial class AgentLoggingPage : Page
             var path = selected?.Path ?? ManagerPaths.AgentLogPath;
             LogPathText.Text = $"Current capture file: {path}";
             var filter = SelectedTypeFilter();
-            var text = string.Equals(path, ManagerPaths.AgentLogPath, StringComparison.OrdinalIgnoreCase)
-                ? ReadCurrentAgentLogTail(path, filter)
-                : await _logReader.ReadAllAsync(path, filter);
-            if (!string.IsNullOrEmpty(text) && text.Length > 10_000)
-            {
-                text = text[^10_000..];
-            }
-            SetLogText(string.IsNullOrWhiteSpace(text)
-                ? $"No log content loaded from: {path}"
-                : text);
-            QueueScrollToBottom();
-            UpdateKnownFileState(path);
+            var isCurrentLog = string.Equals(path, ManagerPaths.AgentLogPath, StringComparison.OrdinalIgnoreCase);
+            var read = await _logReader.ReadLastLinesAsync(
+                path,
+                filter,
+                MaxDisplayLines,
+                isCurrentLog ? CurrentLogTailBytes : long.MaxValue);
+            _logView.ShowRead(
+                path,
+                read,
+                string.IsNullOrWhiteSpace(read.Text) ? $"No log content loaded from: {path}" : read.Text,
+                appendable: isCurrentLog
+                    && string.Equals(filter, "All", StringComparison.OrdinalIgnoreCase)
+                    && !string.IsNullOrWhiteSpace(read.Text));
         }
         finally
         {
@@ -172,88 +224,57 @@ public sealed partial class AgentLoggingPage : Page
 
     private async Task RefreshLiveLogAsync()
     {
-        if (LogSelector.SelectedItem is LogFileItem selected
-            && string.Equals(selected.Path, ManagerPaths.AgentLogPath, StringComparison.OrdinalIgnoreCase)
-            && HasSelectedFileChanged(selected.Path))
+        if (!App.MainWindow.AppWindow.IsVisible)
         {
-            await RefreshAsync();
-        }
-    }
-
-    private static string ReadCurrentAgentLogTail(string path, string typeFilter)
-    {
-        if (!File.Exists(path))
-        {
-            return $"Log file not found: {path}";
+            return;
         }
 
         try
         {
-            var content = ReadSharedTextFile(path);
-            using var reader = new StringReader(content);
-            var lines = new Queue<string>();
-
-            while (reader.ReadLine() is { } line)
+            if (_logFolderWatcher.TakeChanges())
             {
-                if (LineMatchesFilter(line, typeFilter))
+                await LoadLogFilesAsync();
+                if (!IsDisplayedLogCurrent())
                 {
-                    lines.Enqueue(line);
-                    while (lines.Count > 500)
-                    {
-                        lines.Dequeue();
-                    }
+                    await RefreshAsync();
+                    return;
                 }
             }
 
-            return lines.Count == 0
-                ? $"No {typeFilter.ToLowerInvariant()} entries in selected log."
-                : string.Join(Environment.NewLine, lines);
+            if (LogSelector.SelectedItem is LogFileItem selected
+                && string.Equals(selected.Path, ManagerPaths.AgentLogPath, StringComparison.OrdinalIgnoreCase)
+                && _logView.HasFileChanged(selected.Path))
+            {
+                if (await TryAppendLogAsync(selected.Path))
+                {
+                    return;
+                }
+
+                await RefreshAsync();
+            }
         }
         catch (Exception ex)
         {
-            return $"Could not read log file: {path}{Environment.NewLine}{ex.Message}";
+            App.Logger.Warning($"Live agent log refresh failed: {ex.Message}");
         }
     }
 
-    private static string ReadSharedTextFile(string path)
+    private async Task<bool> TryAppendLogAsync(string path)
     {
-        using var stream = new FileStream(path, FileMode.Open, FileAccess.Read, FileShare.ReadWrite | FileShare.Delete);
-        if (stream.Length == 0)
+        if (_refreshing)
         {
-            return string.Empty;
+            return true;
         }
 
-        stream.Seek(0, SeekOrigin.Begin);
-        var buffer = new byte[stream.Length];
-        var offset = 0;
-        while (offset < buffer.Length)
+        _refreshing = true;
+        try
         {
-            var read = stream.Read(buffer, offset, buffer.Length - offset);
-            if (read <= 0)
-            {
-                break;
-            }
-
-            offset += read;
+            return await _logView.TryAppendAsync(_logReader, path);
         }
-
-        return System.Text.Encoding.UTF8.GetString(buffer, 0, offset);
-    }
-
-    private static bool LineMatchesFilter(string line, string typeFilter)
-    {
-        if (string.IsNullOrWhiteSpace(typeFilter) || string.Equals(typeFilter, "All", StringComparison.OrdinalIgnoreCase))
+        finally
         {
-            return true;
+            _refreshing = false;
         }
-
-        return typeFilter.Trim().ToLowerInvariant() switch
-        {
-            "info" => line.Contains("info", StringComparison.OrdinalIgnoreCase),
-            "warnings" => line.Contains("warn", StringComparison.OrdinalIgnoreCase),
-            "errors" => line.Contains("error", StringComparison.OrdinalIgnoreCase),
-            _ => true,
-        };
     }
 
     private string SelectedTypeFilter()
@@ -263,82 +284,9 @@ public sealed partial class AgentLoggingPage : Page
             : "All";
     }
 
-    private bool HasSelectedFileChanged(string path)
+    private bool IsDisplayedLogCurrent()
     {
-        try
-        {
-            var file = new FileInfo(path);
-            return file.Exists
-                && (file.Length != _lastFileLength || file.LastWriteTimeUtc != _lastFileWriteUtc);
-        }
-        catch
-        {
-            return false;
-        }
-    }
-
-    private void UpdateKnownFileState(string path)
-    {
-        try
-        {
-            var file = new FileInfo(path);
-            _lastFileLength = file.Exists ? file.Length : -1;
-            _lastFileWriteUtc = file.Exists ? file.LastWriteTimeUtc : DateTime.MinValue;
-        }
-        catch
-        {
-            _lastFileLength = -1;
-            _lastFileWriteUtc = DateTime.MinValue;
-        }
-    }
-
-    private void QueueScrollToBottom()
-    {
-        DispatcherQueue.TryEnqueue(DispatcherQueuePriority.Low, () =>
-        {
-            LogScrollViewer.UpdateLayout();
-            LogScrollViewer.ChangeView(null, LogScrollViewer.ScrollableHeight, null, true);
-        });
-    }
-
-    private void SetLogText(string text)
-    {
-        LogTextBlock.Blocks.Clear();
-        var paragraph = new Paragraph();
-        var lines = text.Replace("\r\n", "\n").Split('\n');
-        for (var index = 0; index < lines.Length; index++)
-        {
-            var line = lines[index];
-            var run = new Run
-            {
-                Text = index == lines.Length - 1 ? line : $"{line}{Environment.NewLine}",
-            };
-            var brush = BrushForLogLine(line);
-            if (brush is not null)
-            {
-                run.Foreground = brush;
-            }
-
-            paragraph.Inlines.Add(run);
-        }
-
-        LogTextBlock.Blocks.Add(paragraph);
-    }
-
-    private static SolidColorBrush? BrushForLogLine(string line)
-    {
-        if (line.Contains("error", StringComparison.OrdinalIgnoreCase)
-            || line.Contains("fatal", StringComparison.OrdinalIgnoreCase))
-        {
-            return new SolidColorBrush(Colors.Red);
-        }
-
-        if (line.Contains("warn", StringComparison.OrdinalIgnoreCase))
-        {
-            return new SolidColorBrush(Colors.DarkOrange);
-        }
-
-        return null;
+        return LogSelector.SelectedItem is LogFileItem selected && _logView.IsShowing(selected.Path);
     }
 
     private static T? FindVisualChild<T>(DependencyObject root) where T : DependencyObject
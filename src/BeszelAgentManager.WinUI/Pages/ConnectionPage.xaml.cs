@@ -1,4 +1,5 @@
 using BeszelAgentManager.WinUI.Services;
+using Microsoft.UI.Dispatching;
 using Microsoft.UI.Xaml;
 using Microsoft.UI.Xaml.Controls;
 using Microsoft.UI.Xaml.Input;
@@ -11,17 +12,26 @@ public sealed partial class ConnectionPage : Page
     private readonly ConfigService _configService = new();
     private readonly AutostartService _autostartService = new();
     private readonly SystemStatusService _systemStatusService = new();
+    private readonly DispatcherQueueTimer _autosaveTimer;
+    private readonly SemaphoreSlim _saveLock = new(1, 1);
     private AgentConfig _config = new();
     private AgentStatus? _serviceStatus;
     private bool _loading = true;
     private bool _serviceControlsBusy;
     private bool _autostartEnabled;
     private bool _autostartHidden;
+    private string? _pendingSaveDescription;
+    private ConnectionSnapshot? _savedSnapshot;
 
     public ConnectionPage()
     {
         InitializeComponent();
         Loaded += ConnectionPage_Loaded;
+        Unloaded += ConnectionPage_Unloaded;
+        _autosaveTimer = DispatcherQueue.CreateTimer();
+        _autosaveTimer.Interval = TimeSpan.FromMilliseconds(300);
+        _autosaveTimer.IsRepeating = false;
+        _autosaveTimer.Tick += async (_, _) => await FlushPendingSaveAsync();
     }
 
     private async void ConnectionPage_Loaded(object sender, RoutedEventArgs e)
@@ -29,10 +39,16 @@ public sealed partial class ConnectionPage : Page
         _loading = true;
         _config = await _configService.LoadAsync();
         PopulateConfig(_config);
+        _savedSnapshot = File.Exists(ManagerPaths.ConfigPath) ? Snapshot(_config, _autostartEnabled) : null;
         _loading = false;
         await App.MainWindow.RefreshServiceStatusNowAsync();
     }
 
+    private async void ConnectionPage_Unloaded(object sender, RoutedEventArgs e)
+    {
+        await FlushPendingSaveAsync();
+    }
+
     internal void ApplyServiceStatus(AgentStatus status)
     {
         _serviceStatus = status;
@@ -69,14 +85,31 @@ public sealed partial class ConnectionPage : Page
 
     internal async Task<bool> SaveCurrentConfigAsync(bool logNoChanges = true)
     {
-        var before = Snapshot(_config, _autostartEnabled);
-        var persisted = await _configService.LoadAsync();
-        UpdateConfigFromControls();
-        _config.LastAppliedFingerprint = persisted.LastAppliedFingerprint;
-        _config.LastAppliedAt = persisted.LastAppliedAt;
-        _config.LastAppliedManagerTasksFingerprint = persisted.LastAppliedManagerTasksFingerprint;
-        await _configService.SaveAsync(_config);
-        return LogConnectionChanges(before, Snapshot(_config, _autostartEnabled), logNoChanges);
+        _autosaveTimer.Stop();
+        _pendingSaveDescription = null;
+        await _saveLock.WaitAsync();
+        try
+        {
+            var before = _savedSnapshot ?? Snapshot(_config, _autostartEnabled);
+            UpdateConfigFromControls();
+            var after = Snapshot(_config, _autostartEnabled);
+            if (after == _savedSnapshot && File.Exists(ManagerPaths.ConfigPath))
+            {
+                return LogConnectionChanges(before, after, logNoChanges);
+            }
+
+            var persisted = await _configService.LoadAsync();
+            _config.LastAppliedFingerprint = persisted.LastAppliedFingerprint;
+            _config.LastAppliedAt = persisted.LastAppliedAt;
+            _config.LastAppliedManagerTasksFingerprint = persisted.LastAppliedManagerTasksFingerprint;
+            await _configService.SaveAsync(_config);
+            _savedSnapshot = after;
+            return LogConnectionChanges(before, after, logNoChanges);
+        }
+        finally
+        {
+            _saveLock.Release();
+        }
     }
 
     private void UpdateConfigFromControls()
@@ -93,7 +126,8 @@ public sealed partial class ConnectionPage : Page
         _config.UpdateIntervalHours = NormalizeHours(UpdateIntervalTextBox.Text);
         _config.StartHidden = StartVisibleCheckBox.IsChecked != true;
         var autostartEnabled = AutostartCheckBox.IsChecked == true;
-        if (autostartEnabled != _autostartEnabled || _config.StartHidden != _autostartHidden)
+        if (autostartEnabled != _autostartEnabled
+            || (autostartEnabled && _config.StartHidden != _autostartHidden))
         {
             _autostartService.SetState(autostartEnabled, _config.StartHidden);
             _autostartEnabled = autostartEnabled;
@@ -133,6 +167,35 @@ public sealed partial class ConnectionPage : Page
         }
     }
 
+    private async Task QueueControlSaveAsync(string description)
+    {
+        if (_loading)
+        {
+            return;
+        }
+
+        if (_pendingSaveDescription is { } pending && !string.Equals(pending, description, StringComparison.Ordinal))
+        {
+            await FlushPendingSaveAsync();
+        }
+
+        _pendingSaveDescription = description;
+        _autosaveTimer.Stop();
+        _autosaveTimer.Start();
+    }
+
+    private async Task FlushPendingSaveAsync()
+    {
+        _autosaveTimer.Stop();
+        if (_pendingSaveDescription is not { } description)
+        {
+            return;
+        }
+
+        _pendingSaveDescription = null;
+        await SaveControlChangeAsync(description);
+    }
+
     private static bool IsToggleEnabled(Button button)
     {
         return string.Equals(button.Content?.ToString(), "Disable", StringComparison.OrdinalIgnoreCase);
@@ -150,9 +213,20 @@ public sealed partial class ConnectionPage : Page
             : 24;
     }
 
-    private async void KeyChangeButton_Click(object sender, RoutedEventArgs e)
+    private async void TextChangeButton_Click(object sender, RoutedEventArgs e)
     {
-        await ToggleTextEditAsync(KeyTextBox, KeyChangeButton, "Public Key");
+        if (ReferenceEquals(sender, KeyChangeButton))
+        {
+            await ToggleTextEditAsync(KeyTextBox, KeyChangeButton, "Public Key");
+        }
+        else if (ReferenceEquals(sender, HubUrlChangeButton))
+        {
+            await ToggleTextEditAsync(HubUrlTextBox, HubUrlChangeButton, "Hub URL");
+        }
+        else if (ReferenceEquals(sender, FallbackChangeButton))
+        {
+            await ToggleTextEditAsync(FallbackUrlTextBox, FallbackChangeButton, "Hub URL IP fallback");
+        }
     }
 
     private async void TokenChangeButton_Click(object sender, RoutedEventArgs e)
@@ -170,16 +244,6 @@ public sealed partial class ConnectionPage : Page
         await SaveControlChangeAsync("Token");
     }
 
-    private async void HubUrlChangeButton_Click(object sender, RoutedEventArgs e)
-    {
-        await ToggleTextEditAsync(HubUrlTextBox, HubUrlChangeButton, "Hub URL");
-    }
-
-    private async void FallbackChangeButton_Click(object sender, RoutedEventArgs e)
-    {
-        await ToggleTextEditAsync(FallbackUrlTextBox, FallbackChangeButton, "Hub URL IP fallback");
-    }
-
     private async void PortChangeButton_Click(object sender, RoutedEventArgs e)
     {
         if (!PortNumberBox.IsEnabled)
@@ -267,7 +331,7 @@ public sealed partial class ConnectionPage : Page
             : ReferenceEquals(sender, AutostartCheckBox) || ReferenceEquals(sender, StartVisibleCheckBox)
                 ? "Manager startup setting"
                 : "Connection option";
-        await SaveControlChangeAsync(description);
+        await QueueControlSaveAsync(description);
     }
 
     private async void UpdateIntervalTextBox_LostFocus(object sender, RoutedEventArgs args)
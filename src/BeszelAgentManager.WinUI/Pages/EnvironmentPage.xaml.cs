@@ -40,9 +40,27 @@ public sealed partial class EnvironmentPage : Page
         new("SKIP_SYSTEMD", "skip_systemd", "Skips systemd integration when set to 1."),
     ];
 
+    private static readonly Dictionary<string, EnvDefinition> DefinitionsByName =
+        Definitions.ToDictionary(static definition => definition.Name, StringComparer.OrdinalIgnoreCase);
+
+    private static readonly GridLength[] RowColumnWidths =
+    [
+        new(280),
+        new(1, GridUnitType.Star),
+        new(72),
+        new(96),
+    ];
+
     private readonly ConfigService _configService = new();
     private AgentConfig _config = new();
     private EnvDefinition _selectedDefinition = Definitions[0];
+    private Microsoft.UI.Xaml.Media.Brush? _secondaryTextBrush;
+    private Style? _nameTextStyle;
+    private Style? _descriptionTextStyle;
+    private Flyout? _environmentFlyout;
+    private readonly Dictionary<string, Grid> _rowPool = new(StringComparer.OrdinalIgnoreCase);
+    private readonly Dictionary<string, EnvironmentVariableEntry> _customEntries = new(StringComparer.OrdinalIgnoreCase);
+    private readonly HashSet<string> _activeNames = new(StringComparer.OrdinalIgnoreCase);
 
     public EnvironmentPage()
     {
@@ -59,14 +77,14 @@ public sealed partial class EnvironmentPage : Page
 
     private void SelectEnvironmentButton_Click(object sender, RoutedEventArgs e)
     {
-        var flyout = BuildEnvironmentFlyout();
+        var flyout = _environmentFlyout ??= BuildEnvironmentFlyout();
         flyout.ShowAt(SelectEnvironmentButton);
     }
 
     private async void AddEnvironmentButton_Click(object sender, RoutedEventArgs e)
     {
         var name = _selectedDefinition.Name;
-        if (_config.EnvActiveNames.Any(existing => string.Equals(existing, name, StringComparison.OrdinalIgnoreCase)))
+        if (!_activeNames.Add(name))
         {
             App.MainWindow.ShowActionStatus(
                 InfoBarSeverity.Informational,
@@ -76,31 +94,135 @@ public sealed partial class EnvironmentPage : Page
         }
 
         _config.EnvActiveNames.Add(name);
-        await SaveAndReportAsync($"Environment variable added: {name}");
-        RenderRows();
+        try
+        {
+            await SaveAndReportAsync($"Environment variable added: {name}");
+        }
+        catch (Exception ex)
+        {
+            _config.EnvActiveNames.Remove(name);
+            _activeNames.Remove(name);
+            App.Logger.Error($"Could not add environment variable {name}: {ex}");
+            App.MainWindow.ShowActionStatus(InfoBarSeverity.Error, "Could not save environment", ex.Message);
+            return;
+        }
+
+        InsertEnvironmentRow(name, _selectedDefinition.ConfigKey, _config.GetEnvironmentValue(_selectedDefinition.ConfigKey));
     }
 
     private void RenderRows()
     {
-        EnvironmentListView.Items.Clear();
+        _customEntries.Clear();
+        foreach (var entry in _config.EnvCustom)
+        {
+            _customEntries.TryAdd(entry.Name.Trim(), entry);
+        }
+
+        _activeNames.Clear();
+        _activeNames.UnionWith(_config.EnvActiveNames);
 
         var rows = _configService.GetActiveEnvironmentRows(_config)
             .OrderBy(static row => row.Name, StringComparer.OrdinalIgnoreCase)
             .ToList();
+        var items = EnvironmentListView.Items;
         if (rows.Count == 0)
         {
-            EnvironmentListView.Items.Add(new TextBlock
+            if (items.Count != 1 || items[0] is not TextBlock)
             {
-                Text = "No environment variables are active.",
-                Foreground = (Microsoft.UI.Xaml.Media.Brush)Application.Current.Resources["TextFillColorSecondaryBrush"],
-            });
+                items.Clear();
+                AddEmptyPlaceholder();
+            }
+
             return;
         }
 
+        var desired = new List<Grid>(rows.Count);
+        var keep = new HashSet<Grid>();
         foreach (var row in rows)
         {
-            EnvironmentListView.Items.Add(CreateEnvironmentRow(row.Name, row.ConfigKey, row.Value));
+            var grid = GetEnvironmentRow(row.Name, row.ConfigKey, row.Value);
+            if (keep.Add(grid))
+            {
+                desired.Add(grid);
+            }
+        }
+
+        for (var index = items.Count - 1; index >= 0; index--)
+        {
+            if (items[index] is not Grid grid || !keep.Contains(grid))
+            {
+                items.RemoveAt(index);
+            }
+        }
+
+        for (var index = 0; index < desired.Count; index++)
+        {
+            if (index < items.Count && ReferenceEquals(items[index], desired[index]))
+            {
+                continue;
+            }
+
+            var current = items.IndexOf(desired[index]);
+            if (current >= 0)
+            {
+                items.RemoveAt(current);
+            }
+
+            items.Insert(index, desired[index]);
+        }
+    }
+
+    private void InsertEnvironmentRow(string name, string configKey, string value)
+    {
+        var items = EnvironmentListView.Items;
+        if (items.Count == 1 && items[0] is TextBlock)
+        {
+            items.Clear();
+        }
+
+        var index = 0;
+        while (index < items.Count
+            && items[index] is Grid { Tag: EnvRowState state }
+            && StringComparer.OrdinalIgnoreCase.Compare(state.Name, name) <= 0)
+        {
+            index++;
         }
+
+        items.Insert(index, GetEnvironmentRow(name, configKey, value));
+    }
+
+    private Grid GetEnvironmentRow(string name, string configKey, string value)
+    {
+        if (_rowPool.TryGetValue(name, out var row)
+            && row.Tag is EnvRowState state
+            && string.Equals(state.ConfigKey, configKey, StringComparison.Ordinal))
+        {
+            if (!string.Equals(state.ValueBox.Text, value, StringComparison.Ordinal))
+            {
+                state.ValueBox.Text = value;
+            }
+
+            if (!state.ValueBox.IsReadOnly)
+            {
+                state.ValueBox.IsReadOnly = true;
+                state.EditButton.Content = "Edit";
+            }
+
+            return row;
+        }
+
+        row = CreateEnvironmentRow(name, configKey, value);
+        _rowPool[name] = row;
+        return row;
+    }
+
+    private void AddEmptyPlaceholder()
+    {
+        EnvironmentListView.Items.Add(new TextBlock
+        {
+            Text = "No environment variables are active.",
+            Foreground = SecondaryTextBrush,
+        });
     }
 
     private Grid CreateEnvironmentRow(string name, string configKey, string value)
@@ -111,28 +233,25 @@ public sealed partial class EnvironmentPage : Page
             Height = 76,
             Margin = new Thickness(0, 0, 0, 4),
             Padding = new Thickness(8, 6, 8, 6),
-            Tag = new EnvRowState(name, configKey),
         };
-        grid.ColumnDefinitions.Add(new ColumnDefinition { Width = new GridLength(280) });
-        grid.ColumnDefinitions.Add(new ColumnDefinition { Width = new GridLength(1, GridUnitType.Star) });
-        grid.ColumnDefinitions.Add(new ColumnDefinition { Width = new GridLength(72) });
-        grid.ColumnDefinitions.Add(new ColumnDefinition { Width = new GridLength(96) });
+        foreach (var width in RowColumnWidths)
+        {
+            grid.ColumnDefinitions.Add(new ColumnDefinition { Width = width });
+        }
 
         var definition = FindDefinition(name);
         var labelPanel = new StackPanel { Spacing = 3, VerticalAlignment = VerticalAlignment.Center };
         labelPanel.Children.Add(new TextBlock
         {
             Text = $"{name}:",
-            FontWeight = Microsoft.UI.Text.FontWeights.SemiBold,
+            Style = NameTextStyle,
         });
         labelPanel.Children.Add(new TextBlock
         {
             Text = definition?.Description ?? "Custom environment variable.",
-            Foreground = (Microsoft.UI.Xaml.Media.Brush)Application.Current.Resources["TextFillColorSecondaryBrush"],
+            Style = DescriptionTextStyle,
             TextWrapping = TextWrapping.Wrap,
-            FontSize = 12,
             MaxLines = 2,
-            TextTrimming = Microsoft.UI.Xaml.TextTrimming.CharacterEllipsis,
         });
         var textBox = new TextBox
         {
@@ -140,11 +259,12 @@ public sealed partial class EnvironmentPage : Page
             IsReadOnly = true,
             VerticalAlignment = VerticalAlignment.Center,
         };
-        var editButton = new Button { Content = "Edit", VerticalAlignment = VerticalAlignment.Center };
-        var removeButton = new Button { Content = "Remove", VerticalAlignment = VerticalAlignment.Center };
+        var editButton = new Button { Content = "Edit", VerticalAlignment = VerticalAlignment.Center, Tag = grid };
+        var removeButton = new Button { Content = "Remove", VerticalAlignment = VerticalAlignment.Center, Tag = grid };
+        grid.Tag = new EnvRowState(name, configKey, textBox, editButton);
 
-        editButton.Click += async (_, _) => await EditEnvironmentRowAsync(grid, textBox, editButton);
-        removeButton.Click += async (_, _) => await RemoveEnvironmentRowAsync(grid);
+        editButton.Click += EnvironmentEditButton_Click;
+        removeButton.Click += EnvironmentRemoveButton_Click;
 
         Grid.SetColumn(textBox, 1);
         Grid.SetColumn(editButton, 2);
@@ -156,13 +276,26 @@ public sealed partial class EnvironmentPage : Page
         return grid;
     }
 
-    private async Task EditEnvironmentRowAsync(Grid row, TextBox textBox, Button editButton)
+    private async void EnvironmentEditButton_Click(object sender, RoutedEventArgs e)
     {
-        if (row.Tag is not EnvRowState state)
+        if (sender is Button { Tag: Grid { Tag: EnvRowState state } })
         {
-            return;
+            await EditEnvironmentRowAsync(state);
         }
+    }
+
+    private async void EnvironmentRemoveButton_Click(object sender, RoutedEventArgs e)
+    {
+        if (sender is Button { Tag: Grid row })
+        {
+            await RemoveEnvironmentRowAsync(row);
+        }
+    }
 
+    private async Task EditEnvironmentRowAsync(EnvRowState state)
+    {
+        var textBox = state.ValueBox;
+        var editButton = state.EditButton;
         if (textBox.IsReadOnly)
         {
             textBox.IsReadOnly = false;
@@ -173,10 +306,16 @@ public sealed partial class EnvironmentPage : Page
         }
 
         var before = GetEnvironmentValue(state);
-        SetEnvironmentValue(state, textBox.Text.Trim());
+        var after = textBox.Text.Trim();
         textBox.IsReadOnly = true;
         editButton.Content = "Edit";
-        await SaveAndReportAsync($"Environment variable {state.Name}: {Format(before)} -> {Format(textBox.Text.Trim())}");
+        if (string.Equals(before, after, StringComparison.Ordinal))
+        {
+            return;
+        }
+
+        SetEnvironmentValue(state, after);
+        await SaveAndReportAsync($"Environment variable {state.Name}: {Format(before)} -> {Format(after)}");
     }
 
     private async Task RemoveEnvironmentRowAsync(Grid row)
@@ -188,20 +327,35 @@ public sealed partial class EnvironmentPage : Page
 
         _config.EnvActiveNames.RemoveAll(name => string.Equals(name, state.Name, StringComparison.OrdinalIgnoreCase));
         _config.EnvCustom.RemoveAll(item => string.Equals(item.Name, state.Name, StringComparison.OrdinalIgnoreCase));
+        _customEntries.Remove(state.Name);
+        _activeNames.Remove(state.Name);
+        _rowPool.Remove(state.Name);
         await SaveAndReportAsync($"Environment variable removed: {state.Name}");
-        RenderRows();
+        for (var index = EnvironmentListView.Items.Count - 1; index >= 0; index--)
+        {
+            if (EnvironmentListView.Items[index] is Grid { Tag: EnvRowState existing }
+                && string.Equals(existing.Name, state.Name, StringComparison.OrdinalIgnoreCase))
+            {
+                EnvironmentListView.Items.RemoveAt(index);
+            }
+        }
+
+        if (EnvironmentListView.Items.Count == 0)
+        {
+            AddEmptyPlaceholder();
+        }
     }
 
     private string GetEnvironmentValue(EnvRowState state)
     {
-        var custom = _config.EnvCustom.FirstOrDefault(item => string.Equals(item.Name, state.Name, StringComparison.OrdinalIgnoreCase));
-        return custom?.Value ?? _config.GetEnvironmentValue(state.ConfigKey);
+        return _customEntries.TryGetValue(state.Name, out var custom)
+            ? custom.Value
+            : _config.GetEnvironmentValue(state.ConfigKey);
     }
 
     private void SetEnvironmentValue(EnvRowState state, string value)
     {
-        var custom = _config.EnvCustom.FirstOrDefault(item => string.Equals(item.Name, state.Name, StringComparison.OrdinalIgnoreCase));
-        if (custom is not null)
+        if (_customEntries.TryGetValue(state.Name, out var custom))
         {
             custom.Value = value;
             return;
@@ -224,6 +378,13 @@ public sealed partial class EnvironmentPage : Page
             "Apply settings when you are ready to restart the service with these environment changes.");
     }
 
+    private Style NameTextStyle => _nameTextStyle ??= (Style)Resources["EnvironmentNameTextStyle"];
+
+    private Style DescriptionTextStyle => _descriptionTextStyle ??= (Style)Resources["EnvironmentDescriptionTextStyle"];
+
+    private Microsoft.UI.Xaml.Media.Brush SecondaryTextBrush =>
+        _secondaryTextBrush ??= (Microsoft.UI.Xaml.Media.Brush)Application.Current.Resources["TextFillColorSecondaryBrush"];
+
     private static string Format(string value)
     {
         return string.IsNullOrWhiteSpace(value) ? "(empty)" : value;
@@ -242,14 +403,7 @@ public sealed partial class EnvironmentPage : Page
                 Content = CreateEnvironmentOptionContent(definition),
                 Tag = definition,
             };
-            button.Click += (_, _) =>
-            {
-                SetSelectedDefinition(definition);
-                if (SelectEnvironmentButton.Flyout is FlyoutBase attachedFlyout)
-                {
-                    attachedFlyout.Hide();
-                }
-            };
+            button.Click += EnvironmentOption_Click;
             list.Children.Add(button);
         }
 
@@ -269,23 +423,34 @@ public sealed partial class EnvironmentPage : Page
         return flyout;
     }
 
-    private static StackPanel CreateEnvironmentOptionContent(EnvDefinition definition)
+    private void EnvironmentOption_Click(object sender, RoutedEventArgs e)
+    {
+        if (sender is not Button { Tag: EnvDefinition definition })
+        {
+            return;
+        }
+
+        SetSelectedDefinition(definition);
+        if (SelectEnvironmentButton.Flyout is FlyoutBase attachedFlyout)
+        {
+            attachedFlyout.Hide();
+        }
+    }
+
+    private StackPanel CreateEnvironmentOptionContent(EnvDefinition definition)
     {
         var panel = new StackPanel { Spacing = 2 };
         panel.Children.Add(new TextBlock
         {
             Text = definition.Name,
-            FontWeight = Microsoft.UI.Text.FontWeights.SemiBold,
+            Style = NameTextStyle,
             MaxLines = 1,
-            TextTrimming = TextTrimming.CharacterEllipsis,
         });
         panel.Children.Add(new TextBlock
         {
             Text = definition.Description,
-            Foreground = (Microsoft.UI.Xaml.Media.Brush)Application.Current.Resources["TextFillColorSecondaryBrush"],
-            FontSize = 12,
+            Style = DescriptionTextStyle,
             MaxLines = 1,
-            TextTrimming = TextTrimming.CharacterEllipsis,
         });
 
         return panel;
@@ -294,7 +459,8 @@ public sealed partial class EnvironmentPage : Page
     private void SetSelectedDefinition(EnvDefinition definition)
     {
         _selectedDefinition = definition;
-        if (SelectedEnvironmentNameText is not null)
+        if (SelectedEnvironmentNameText is not null
+            && !string.Equals(SelectedEnvironmentNameText.Text, definition.Name, StringComparison.Ordinal))
         {
             SelectedEnvironmentNameText.Text = definition.Name;
         }
@@ -302,10 +468,10 @@ public sealed partial class EnvironmentPage : Page
 
     private static EnvDefinition? FindDefinition(string name)
     {
-        return Definitions.FirstOrDefault(definition => string.Equals(definition.Name, name, StringComparison.OrdinalIgnoreCase));
+        return DefinitionsByName.GetValueOrDefault(name);
     }
 
     private sealed record EnvDefinition(string Name, string ConfigKey, string Description);
 
-    private sealed record EnvRowState(string Name, string ConfigKey);
+    private sealed record EnvRowState(string Name, string ConfigKey, TextBox ValueBox, Button EditButton);
 }
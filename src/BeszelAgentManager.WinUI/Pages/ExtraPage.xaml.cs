@@ -1,4 +1,5 @@
 using BeszelAgentManager.WinUI.Services;
+using Microsoft.UI.Dispatching;
 using Microsoft.UI.Xaml.Input;
 using Microsoft.UI.Xaml;
 using Microsoft.UI.Xaml.Controls;
@@ -12,13 +13,24 @@ public sealed partial class ExtraPage : Page
     private readonly ConfigService _configService = new();
     private readonly GitHubTokenService _gitHubTokenService = new();
     private readonly AgentFingerprintService _fingerprintService = new();
+    private readonly DispatcherQueueTimer _autosaveTimer;
     private AgentConfig _config = new();
     private bool _loading = true;
+    private bool _periodicRestartSavePending;
+    private ContentDialog? _thirdPartyAvDialog;
+    private string _thirdPartyAvInstructions = string.Empty;
+    private ContentDialog? _fingerprintDialog;
+    private TextBox? _fingerprintTextBox;
 
     public ExtraPage()
     {
         InitializeComponent();
         Loaded += ExtraPage_Loaded;
+        Unloaded += ExtraPage_Unloaded;
+        _autosaveTimer = DispatcherQueue.CreateTimer();
+        _autosaveTimer.Interval = TimeSpan.FromMilliseconds(300);
+        _autosaveTimer.IsRepeating = false;
+        _autosaveTimer.Tick += async (_, _) => await FlushPeriodicRestartSaveAsync();
     }
 
     private async void ExtraPage_Loaded(object sender, RoutedEventArgs e)
@@ -38,10 +50,15 @@ public sealed partial class ExtraPage : Page
         _loading = false;
     }
 
-    private async void AutoRestartCheckBox_Click(object sender, RoutedEventArgs e)
+    private async void ExtraPage_Unloaded(object sender, RoutedEventArgs e)
+    {
+        await FlushPeriodicRestartSaveAsync();
+    }
+
+    private void AutoRestartCheckBox_Click(object sender, RoutedEventArgs e)
     {
         UpdatePeriodicRestartControlState();
-        await SavePeriodicRestartAsync();
+        QueuePeriodicRestartSave();
     }
 
     private async void RestartIntervalTextBox_LostFocus(object sender, RoutedEventArgs e)
@@ -60,13 +77,38 @@ public sealed partial class ExtraPage : Page
         await SavePeriodicRestartAsync();
     }
 
-    private async void RestartIntervalUnitComboBox_SelectionChanged(object sender, SelectionChangedEventArgs e)
+    private void RestartIntervalUnitComboBox_SelectionChanged(object sender, SelectionChangedEventArgs e)
+    {
+        QueuePeriodicRestartSave();
+    }
+
+    private void QueuePeriodicRestartSave()
+    {
+        if (_loading)
+        {
+            return;
+        }
+
+        _periodicRestartSavePending = true;
+        _autosaveTimer.Stop();
+        _autosaveTimer.Start();
+    }
+
+    private async Task FlushPeriodicRestartSaveAsync()
     {
+        _autosaveTimer.Stop();
+        if (!_periodicRestartSavePending)
+        {
+            return;
+        }
+
         await SavePeriodicRestartAsync();
     }
 
     private async Task SavePeriodicRestartAsync()
     {
+        _autosaveTimer.Stop();
+        _periodicRestartSavePending = false;
         if (_loading)
         {
             return;
@@ -84,7 +126,15 @@ public sealed partial class ExtraPage : Page
             return;
         }
 
-        _config.AutoRestartEnabled = AutoRestartCheckBox.IsChecked == true;
+        var enabled = AutoRestartCheckBox.IsChecked == true;
+        if (enabled == _config.AutoRestartEnabled
+            && interval == _config.AutoRestartIntervalValue
+            && string.Equals(unit, _config.AutoRestartIntervalUnit, StringComparison.Ordinal))
+        {
+            return;
+        }
+
+        _config.AutoRestartEnabled = enabled;
         _config.AutoRestartIntervalValue = interval;
         _config.AutoRestartIntervalUnit = unit;
         _config.AutoRestartIntervalHours = unit == "hours"
@@ -190,6 +240,22 @@ public sealed partial class ExtraPage : Page
     }
 
     private async void ThirdPartyAvButton_Click(object sender, RoutedEventArgs e)
+    {
+        _thirdPartyAvDialog ??= BuildThirdPartyAvDialog();
+        _thirdPartyAvDialog.XamlRoot = XamlRoot;
+        if (await _thirdPartyAvDialog.ShowAsync() == ContentDialogResult.Primary)
+        {
+            var package = new DataPackage();
+            package.SetText(_thirdPartyAvInstructions);
+            Clipboard.SetContent(package);
+            App.MainWindow.ShowActionStatus(
+                InfoBarSeverity.Success,
+                "Instructions copied",
+                "The antivirus allowlist instructions were copied to the clipboard.");
+        }
+    }
+
+    private ContentDialog BuildThirdPartyAvDialog()
     {
         var programFiles = Environment.GetFolderPath(Environment.SpecialFolder.ProgramFiles);
         var programData = Environment.GetFolderPath(Environment.SpecialFolder.CommonApplicationData);
@@ -216,7 +282,7 @@ public sealed partial class ExtraPage : Page
                 "BeszelAgentManagerSetup.exe (only while installing or updating)",
             ]),
         ];
-        var instructions = string.Join(
+        _thirdPartyAvInstructions = string.Join(
             Environment.NewLine + Environment.NewLine,
             sections.Select(static section =>
                 section.Title + Environment.NewLine +
@@ -232,25 +298,14 @@ public sealed partial class ExtraPage : Page
             Height = 500,
             VerticalScrollBarVisibility = ScrollBarVisibility.Auto,
         };
-        var dialog = new ContentDialog
+        return new ContentDialog
         {
-            XamlRoot = XamlRoot,
             Title = "Third-party antivirus allowlist instructions",
             Content = scrollViewer,
             PrimaryButtonText = "Copy instructions",
             CloseButtonText = "Close",
             DefaultButton = ContentDialogButton.Close,
         };
-        if (await dialog.ShowAsync() == ContentDialogResult.Primary)
-        {
-            var package = new DataPackage();
-            package.SetText(instructions);
-            Clipboard.SetContent(package);
-            App.MainWindow.ShowActionStatus(
-                InfoBarSeverity.Success,
-                "Instructions copied",
-                "The antivirus allowlist instructions were copied to the clipboard.");
-        }
 
         void AddSection(string title, IEnumerable<string> values)
         {
@@ -434,27 +489,29 @@ public sealed partial class ExtraPage : Page
 
     private async Task ShowFingerprintDialogAsync(string fingerprint)
     {
-        var textBox = new TextBox
+        _fingerprintTextBox ??= new TextBox
         {
-            Text = fingerprint.Trim(),
             IsReadOnly = true,
             Width = 520,
         };
-
-        var dialog = new ContentDialog
+        _fingerprintDialog ??= new ContentDialog
         {
-            XamlRoot = XamlRoot,
             Title = "Agent Fingerprint",
-            Content = textBox,
+            Content = _fingerprintTextBox,
             PrimaryButtonText = "Copy",
             CloseButtonText = "Close",
             DefaultButton = ContentDialogButton.Primary,
         };
 
-        if (await dialog.ShowAsync() == ContentDialogResult.Primary)
+        var value = fingerprint.Trim();
+        _fingerprintTextBox.Text = value;
+        _fingerprintDialog.XamlRoot = XamlRoot;
+        var result = await _fingerprintDialog.ShowAsync();
+        _fingerprintTextBox.Text = string.Empty;
+        if (result == ContentDialogResult.Primary)
         {
             var package = new DataPackage();
-            package.SetText(textBox.Text);
+            package.SetText(value);
             Clipboard.SetContent(package);
             App.MainWindow.ShowActionStatus(InfoBarSeverity.Success, "Fingerprint copied", "The agent fingerprint was copied to the clipboard.");
         }
@@ -0,0 +1,236 @@
+using BeszelAgentManager.WinUI.Services;
+using Microsoft.UI;
+using Microsoft.UI.Xaml.Controls;
+using Microsoft.UI.Xaml.Documents;
+using Microsoft.UI.Xaml.Media;
+
+namespace BeszelAgentManager.WinUI.Pages;
+
+internal sealed class LogTextView
+{
+    private const int ParagraphCacheLimit = 4;
+    private readonly RichTextBlock _textBlock;
+    private readonly ScrollViewer _scrollViewer;
+    private readonly int _maxLines;
+    private readonly Func<string, string> _formatLine;
+    private readonly SolidColorBrush _errorBrush = new(Colors.Red);
+    private readonly SolidColorBrush _warningBrush = new(Colors.DarkOrange);
+    private readonly List<(string Text, Paragraph Paragraph)> _paragraphCache = [];
+    private string? _displayedText;
+    private string _lastLine = string.Empty;
+    private bool _lastLineComplete = true;
+    private bool _scrollToEndPending;
+    private long _fileLength = -1;
+    private DateTime _fileWriteUtc = DateTime.MinValue;
+
+    public LogTextView(RichTextBlock textBlock, ScrollViewer scrollViewer, int maxLines, Func<string, string>? formatLine = null)
+    {
+        _textBlock = textBlock;
+        _scrollViewer = scrollViewer;
+        _maxLines = maxLines;
+        _formatLine = formatLine ?? (static line => line);
+    }
+
+    public string DisplayedPath { get; private set; } = string.Empty;
+
+    public bool Appendable { get; private set; }
+
+    public void ShowRead(string path, LogReadResult read, string text, bool appendable)
+    {
+        SetText(text, read.EndsWithNewline);
+        ScrollToEnd();
+        DisplayedPath = path;
+        Appendable = appendable && read.Length > 0;
+        _fileLength = read.Length;
+        _fileWriteUtc = read.WriteTimeUtc;
+    }
+
+    public async Task<bool> TryAppendAsync(LogReaderService reader, string path)
+    {
+        if (!Appendable || !string.Equals(DisplayedPath, path, StringComparison.OrdinalIgnoreCase))
+        {
+            return false;
+        }
+
+        var appended = await reader.ReadAppendedAsync(path, _fileLength);
+        if (appended is null)
+        {
+            return false;
+        }
+
+        Append(appended.Text);
+        ScrollToEnd();
+        _fileLength = appended.Length;
+        _fileWriteUtc = appended.WriteTimeUtc;
+        return true;
+    }
+
+    public bool IsShowing(string path)
+    {
+        return string.Equals(path, DisplayedPath, StringComparison.OrdinalIgnoreCase)
+            && File.Exists(path)
+            && !HasFileChanged(path);
+    }
+
+    public bool HasFileChanged(string path)
+    {
+        try
+        {
+            var file = new FileInfo(path);
+            return file.Exists
+                && (file.Length != _fileLength || file.LastWriteTimeUtc != _fileWriteUtc);
+        }
+        catch
+        {
+            return false;
+        }
+    }
+
+    public void SetText(string text, bool lastLineComplete = true)
+    {
+        if (text.EndsWith('\n'))
+        {
+            text = text[..^(text.EndsWith("\r\n", StringComparison.Ordinal) ? 2 : 1)];
+            lastLineComplete = true;
+        }
+
+        _lastLine = text[(text.LastIndexOf('\n') + 1)..];
+        _lastLineComplete = lastLineComplete;
+        if (_textBlock.Blocks.Count > 0 && string.Equals(text, _displayedText, StringComparison.Ordinal))
+        {
+            return;
+        }
+
+        _displayedText = text;
+        _textBlock.Blocks.Clear();
+        _textBlock.Blocks.Add(GetParagraph(text));
+    }
+
+    private void Append(string text)
+    {
+        if (text.Length == 0)
+        {
+            return;
+        }
+
+        if (_textBlock.Blocks.Count == 0 || _textBlock.Blocks[^1] is not Paragraph paragraph)
+        {
+            SetText(text, text.EndsWith('\n'));
+            return;
+        }
+
+        _displayedText = null;
+        _paragraphCache.RemoveAll(entry => ReferenceEquals(entry.Paragraph, paragraph));
+        var lines = text.Replace("\r\n", "\n").Split('\n');
+        var complete = text.EndsWith('\n');
+        var count = complete ? lines.Length - 1 : lines.Length;
+        var inlines = paragraph.Inlines;
+        var first = 0;
+        if (!_lastLineComplete && inlines.Count > 0 && inlines[^1] is Run partialRun)
+        {
+            _lastLine += lines[0];
+            UpdateRun(partialRun, _lastLine, endsLine: false);
+            first = 1;
+        }
+
+        for (var index = first; index < count; index++)
+        {
+            if (inlines.Count > 0 && inlines[^1] is Run previousRun)
+            {
+                UpdateRun(previousRun, _lastLine, endsLine: true);
+            }
+
+            _lastLine = lines[index];
+            inlines.Add(CreateRun(_lastLine, endsLine: false));
+        }
+
+        _lastLineComplete = complete;
+        while (inlines.Count > _maxLines)
+        {
+            inlines.RemoveAt(0);
+        }
+    }
+
+    private Paragraph GetParagraph(string text)
+    {
+        var index = _paragraphCache.FindIndex(entry => string.Equals(entry.Text, text, StringComparison.Ordinal));
+        if (index >= 0)
+        {
+            var cached = _paragraphCache[index];
+            _paragraphCache.RemoveAt(index);
+            _paragraphCache.Add(cached);
+            return cached.Paragraph;
+        }
+
+        var paragraph = new Paragraph();
+        var lines = text.Replace("\r\n", "\n").Split('\n');
+        for (var line = 0; line < lines.Length; line++)
+        {
+            paragraph.Inlines.Add(CreateRun(lines[line], endsLine: line < lines.Length - 1));
+        }
+
+        _paragraphCache.Add((text, paragraph));
+        if (_paragraphCache.Count > ParagraphCacheLimit)
+        {
+            _paragraphCache.RemoveAt(0);
+        }
+
+        return paragraph;
+    }
+
+    private Run CreateRun(string line, bool endsLine)
+    {
+        var run = new Run();
+        UpdateRun(run, line, endsLine);
+        return run;
+    }
+
+    private void UpdateRun(Run run, string line, bool endsLine)
+    {
+        var display = _formatLine(line.TrimEnd('\r'));
+        run.Text = endsLine ? $"{display}{Environment.NewLine}" : display;
+        var brush = BrushForLogLine(line);
+        if (brush is null)
+        {
+            run.ClearValue(TextElement.ForegroundProperty);
+        }
+        else
+        {
+            run.Foreground = brush;
+        }
+    }
+
+    private SolidColorBrush? BrushForLogLine(string line)
+    {
+        if (line.Contains("error", StringComparison.OrdinalIgnoreCase)
+            || line.Contains("fatal", StringComparison.OrdinalIgnoreCase))
+        {
+            return _errorBrush;
+        }
+
+        if (line.Contains("warn", StringComparison.OrdinalIgnoreCase))
+        {
+            return _warningBrush;
+        }
+
+        return null;
+    }
+
+    private void ScrollToEnd()
+    {
+        if (_scrollToEndPending)
+        {
+            return;
+        }
+
+        _scrollToEndPending = true;
+        _scrollViewer.LayoutUpdated += ScrollViewer_LayoutUpdated;
+    }
+
+    private void ScrollViewer_LayoutUpdated(object? sender, object e)
+    {
+        _scrollViewer.LayoutUpdated -= ScrollViewer_LayoutUpdated;
+        _scrollToEndPending = false;
+        _scrollViewer.ChangeView(null, _scrollViewer.ScrollableHeight, null, true);
+    }
+}
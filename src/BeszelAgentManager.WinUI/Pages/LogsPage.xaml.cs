@@ -1,9 +1,8 @@
+using BeszelAgentManager.Core;
 using BeszelAgentManager.WinUI.Services;
-using Microsoft.UI;
 using Microsoft.UI.Xaml;
 using Microsoft.UI.Xaml.Controls;
 using Microsoft.UI.Dispatching;
-using Microsoft.UI.Xaml.Documents;
 using Microsoft.UI.Xaml.Media;
 using System.Text.RegularExpressions;
 
@@ -11,24 +10,44 @@ namespace BeszelAgentManager.WinUI.Pages;
 
 public sealed partial class LogsPage : Page
 {
+    private const int MaxDisplayLines = 500;
+    private const int LogTailBytes = 128 * 1024;
     private readonly LogReaderService _logReaderService = new();
+    private readonly LogFolderWatcher _logFolderWatcher;
     private readonly ConfigService _configService = new();
-    private readonly SupportBundleService _supportBundleService = new();
+    private SupportBundleService? _supportBundleService;
     private readonly DispatcherQueueTimer _refreshTimer;
+    private readonly DispatcherQueueTimer _selectionRefreshTimer;
+    private readonly LogTextView _logView;
     private bool _refreshing;
     private bool _loadingConfig;
     private bool _loadingLogFiles;
-    private long _lastFileLength = -1;
-    private DateTime _lastFileWriteUtc = DateTime.MinValue;
 
     public LogsPage()
     {
         InitializeComponent();
+        _logView = new LogTextView(LogTextBlock, LogScrollViewer, MaxDisplayLines, NormalizeDisplayLine);
+        _logFolderWatcher = new LogFolderWatcher(
+            (ManagerPaths.ManagerLogDir, Path.GetFileName(ManagerPaths.ManagerLogPath)),
+            (ManagerPaths.ManagerLogArchiveDir, "manager-*.txt"));
+        foreach (var failure in _logFolderWatcher.Failures)
+        {
+            App.Logger.Debug($"Log folder watcher unavailable for {failure}");
+        }
+
         Loaded += LogsPage_Loaded;
         Unloaded += LogsPage_Unloaded;
         _refreshTimer = DispatcherQueue.CreateTimer();
         _refreshTimer.Interval = TimeSpan.FromSeconds(2);
         _refreshTimer.Tick += async (_, _) => await RefreshLiveLogAsync();
+        _selectionRefreshTimer = DispatcherQueue.CreateTimer();
+        _selectionRefreshTimer.Interval = TimeSpan.FromMilliseconds(150);
+        _selectionRefreshTimer.IsRepeating = false;
+        _selectionRefreshTimer.Tick += async (_, _) =>
+        {
+            _selectionRefreshTimer.Stop();
+            await RefreshLogAsync();
+        };
     }
 
     private async void LogsPage_Loaded(object sender, RoutedEventArgs e)
@@ -39,30 +58,39 @@ public sealed partial class LogsPage : Page
         _loadingConfig = false;
         App.Logger.Debug("Logging page opened");
         ManagerLogFolderText.Text = $"Manager log folder: {ManagerPaths.ManagerLogDir}";
-        ManagerLogFileText.Text = $"Current file: {ManagerPaths.ManagerLogPath}";
-        LoadLogFiles();
-        await RefreshLogAsync();
+        if (_logFolderWatcher.TakeChanges() || !_logFolderWatcher.IsComplete)
+        {
+            await LoadLogFilesAsync();
+        }
+
+        if (!IsDisplayedLogCurrent())
+        {
+            await RefreshLogAsync();
+        }
+
         _refreshTimer.Start();
     }
 
     private void LogsPage_Unloaded(object sender, RoutedEventArgs e)
     {
         _refreshTimer.Stop();
+        _selectionRefreshTimer.Stop();
     }
 
     private async void RefreshButton_Click(object sender, RoutedEventArgs e)
     {
         App.Logger.Debug("Manager log refresh requested");
-        LoadLogFiles();
+        await LoadLogFilesAsync();
         await RefreshLogAsync();
     }
 
-    private async void LogSelector_SelectionChanged(object sender, SelectionChangedEventArgs e)
+    private void LogSelector_SelectionChanged(object sender, SelectionChangedEventArgs e)
     {
         if (IsLoaded && !_loadingLogFiles && LogSelector.SelectedItem is LogFileItem selected)
         {
             App.Logger.Debug($"Manager log file selected: {selected.Path}");
-            await RefreshLogAsync();
+            _selectionRefreshTimer.Stop();
+            _selectionRefreshTimer.Start();
         }
     }
 
@@ -89,6 +117,11 @@ public sealed partial class LogsPage : Page
         }
 
         var enabled = DebugLoggingCheckBox.IsChecked == true;
+        if (enabled == App.Logger.DebugEnabled)
+        {
+            return;
+        }
+
         await _configService.SetDebugLoggingAsync(enabled);
         App.Logger.SetDebugEnabled(enabled);
         App.Logger.Info($"Manager debug logging {(enabled ? "enabled" : "disabled")}");
@@ -105,7 +138,7 @@ public sealed partial class LogsPage : Page
         App.Logger.Info("Support bundle export requested");
         try
         {
-            var path = await _supportBundleService.CreateAsync();
+            var path = await (_supportBundleService ??= new()).CreateAsync();
             App.Logger.Info($"Support bundle created: {path}");
             App.MainWindow.ShowActionStatus(
                 InfoBarSeverity.Success,
@@ -124,7 +157,7 @@ public sealed partial class LogsPage : Page
         finally
         {
             ExportSupportBundleButton.IsEnabled = true;
-            LoadLogFiles();
+            await LoadLogFilesAsync();
             await RefreshLogAsync();
         }
     }
@@ -150,25 +183,31 @@ public sealed partial class LogsPage : Page
                 ex.Message);
         }
 
-        LoadLogFiles();
+        await LoadLogFilesAsync();
         await RefreshLogAsync();
     }
 
-    private void LoadLogFiles()
+    private async Task LoadLogFilesAsync()
     {
+        var files = await Task.Run(() => _logReaderService.ListManagerLogFiles());
         _loadingLogFiles = true;
         var selectedPath = (LogSelector.SelectedItem as LogFileItem)?.Path;
-        var files = _logReaderService.ListManagerLogFiles();
-        LogSelector.Items.Clear();
-
-        foreach (var file in files)
+        if (LogSelectorMatches(files))
         {
-            LogSelector.Items.Add(file);
+            files = LogSelector.Items.Cast<LogFileItem>().ToList();
+        }
+        else
+        {
+            LogSelector.Items.Clear();
+            foreach (var file in files)
+            {
+                LogSelector.Items.Add(file);
+            }
         }
 
         if (LogSelector.Items.Count == 0)
         {
-            SetLogText("(No manager logs found yet.)");
+            _logView.SetText("(No manager logs found yet.)");
             _loadingLogFiles = false;
             return;
         }
@@ -178,6 +217,24 @@ public sealed partial class LogsPage : Page
         _loadingLogFiles = false;
     }
 
+    private bool LogSelectorMatches(IReadOnlyList<LogFileItem> files)
+    {
+        if (LogSelector.Items.Count != files.Count)
+        {
+            return false;
+        }
+
+        for (var index = 0; index < files.Count; index++)
+        {
+            if (!Equals(LogSelector.Items[index], files[index]))
+            {
+                return false;
+            }
+        }
+
+        return true;
+    }
+
     private async Task RefreshLogAsync()
     {
         if (_refreshing)
@@ -192,10 +249,13 @@ public sealed partial class LogsPage : Page
             var selected = LogSelector.SelectedItem as LogFileItem;
             var path = selected?.Path ?? ManagerPaths.ManagerLogPath;
             ManagerLogFileText.Text = $"Current file: {path}";
-            var text = await _logReaderService.ReadTailFilteredAsync(path, SelectedTypeFilter());
-            SetLogText(text);
-            QueueScrollToBottom();
-            UpdateKnownFileState(path);
+            var typeFilter = SelectedTypeFilter();
+            var read = await _logReaderService.ReadLastLinesAsync(path, typeFilter, MaxDisplayLines, LogTailBytes);
+            _logView.ShowRead(
+                path,
+                read,
+                read.Text,
+                appendable: string.Equals(typeFilter, "All", StringComparison.OrdinalIgnoreCase));
         }
         finally
         {
@@ -206,97 +266,85 @@ public sealed partial class LogsPage : Page
 
     private async Task RefreshLiveLogAsync()
     {
-        if (LogSelector.SelectedItem is LogFileItem selected
-            && string.Equals(selected.Path, ManagerPaths.ManagerLogPath, StringComparison.OrdinalIgnoreCase)
-            && HasSelectedFileChanged(selected.Path))
+        if (!App.MainWindow.AppWindow.IsVisible)
         {
-            await RefreshLogAsync();
+            return;
         }
-    }
-
-    private string SelectedTypeFilter()
-    {
-        return TypeFilterComboBox.SelectedItem is ComboBoxItem item
-            ? item.Content?.ToString() ?? "All"
-            : "All";
-    }
 
-    private static void OpenFolder(string path)
-    {
         try
         {
-            System.Diagnostics.Process.Start(new System.Diagnostics.ProcessStartInfo
+            if (_logFolderWatcher.TakeChanges())
             {
-                FileName = path,
-                UseShellExecute = true,
-            });
+                await LoadLogFilesAsync();
+                if (!IsDisplayedLogCurrent())
+                {
+                    await RefreshLogAsync();
+                    return;
+                }
+            }
+
+            if (LogSelector.SelectedItem is LogFileItem selected
+                && string.Equals(selected.Path, ManagerPaths.ManagerLogPath, StringComparison.OrdinalIgnoreCase)
+                && _logView.HasFileChanged(selected.Path))
+            {
+                if (await TryAppendLogAsync(selected.Path))
+                {
+                    return;
+                }
+
+                await RefreshLogAsync();
+            }
         }
-        catch
+        catch (Exception ex)
         {
-            // Read-only migration slice: ignore shell launch failures for now.
+            App.Logger.Warning($"Live manager log refresh failed: {ex.Message}");
         }
     }
 
-    private bool HasSelectedFileChanged(string path)
+    private async Task<bool> TryAppendLogAsync(string path)
     {
-        try
-        {
-            var file = new FileInfo(path);
-            return file.Exists
-                && (file.Length != _lastFileLength || file.LastWriteTimeUtc != _lastFileWriteUtc);
-        }
-        catch
+        if (_refreshing)
         {
-            return false;
+            return true;
         }
-    }
 
-    private void UpdateKnownFileState(string path)
-    {
+        _refreshing = true;
         try
         {
-            var file = new FileInfo(path);
-            _lastFileLength = file.Exists ? file.Length : -1;
-            _lastFileWriteUtc = file.Exists ? file.LastWriteTimeUtc : DateTime.MinValue;
+            return await _logView.TryAppendAsync(_logReaderService, path);
         }
-        catch
+        finally
         {
-            _lastFileLength = -1;
-            _lastFileWriteUtc = DateTime.MinValue;
+            _refreshing = false;
         }
     }
 
-    private void QueueScrollToBottom()
+    private string SelectedTypeFilter()
     {
-        DispatcherQueue.TryEnqueue(DispatcherQueuePriority.Low, () =>
-        {
-            LogScrollViewer.UpdateLayout();
-            LogScrollViewer.ChangeView(null, LogScrollViewer.ScrollableHeight, null, true);
-        });
+        return TypeFilterComboBox.SelectedItem is ComboBoxItem item
+            ? item.Content?.ToString() ?? "All"
+            : "All";
     }
 
-    private void SetLogText(string text)
+    private static void OpenFolder(string path)
     {
-        LogTextBlock.Blocks.Clear();
-        var paragraph = new Paragraph();
-        var lines = text.Replace("\r\n", "\n").Split('\n');
-        for (var index = 0; index < lines.Length; index++)
+        try
         {
-            var line = lines[index];
-            var run = new Run
-            {
-                Text = index == lines.Length - 1 ? NormalizeDisplayLine(line) : $"{NormalizeDisplayLine(line)}{Environment.NewLine}",
-            };
-            var brush = BrushForLogLine(line);
-            if (brush is not null)
+            System.Diagnostics.Process.Start(new System.Diagnostics.ProcessStartInfo
             {
-                run.Foreground = brush;
-            }
-
-            paragraph.Inlines.Add(run);
+                FileName = path,
+                UseShellExecute = true,
+            });
         }
+        catch
+        {
+            // Read-only migration slice: ignore shell launch failures for now.
+        }
+    }
 
-        LogTextBlock.Blocks.Add(paragraph);
+    private bool IsDisplayedLogCurrent()
+    {
+        return LogSelector.SelectedItem is LogFileItem selected && _logView.IsShowing(selected.Path);
     }
 
     private static string NormalizeDisplayLine(string line)
@@ -327,22 +375,6 @@ public sealed partial class LogsPage : Page
         return $"{timestamp} {level} {message}";
     }
 
-    private static SolidColorBrush? BrushForLogLine(string line)
-    {
-        if (line.Contains("error", StringComparison.OrdinalIgnoreCase)
-            || line.Contains("fatal", StringComparison.OrdinalIgnoreCase))
-        {
-            return new SolidColorBrush(Colors.Red);
-        }
-
-        if (line.Contains("warn", StringComparison.OrdinalIgnoreCase))
-        {
-            return new SolidColorBrush(Colors.DarkOrange);
-        }
-
-        return null;
-    }
-
     [GeneratedRegex(@"^\[(?<timestamp>\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})\]\s*(?<message>.*)$")]
     private static partial Regex LegacyManagerLineRegex();
 
@@ -368,21 +400,14 @@ public sealed partial class LogsPage : Page
 
     private static void RotateManagerLog()
     {
-        if (!File.Exists(ManagerPaths.ManagerLogPath))
-        {
-            return;
-        }
-
-        var content = File.ReadAllText(ManagerPaths.ManagerLogPath);
-        if (string.IsNullOrEmpty(content))
+        var file = new FileInfo(ManagerPaths.ManagerLogPath);
+        if (!file.Exists || file.Length == 0)
         {
             return;
         }
 
         var archiveDir = ManagerPaths.ManagerLogArchiveDir;
         Directory.CreateDirectory(archiveDir);
-        var archivePath = Path.Combine(archiveDir, $"manager-{DateTime.Today:yyyy-MM-dd}.txt");
-        File.AppendAllText(archivePath, content);
-        File.WriteAllText(ManagerPaths.ManagerLogPath, string.Empty);
+        ManagerLogger.ArchiveCurrentLog(Path.Combine(archiveDir, $"manager-{DateTime.Today:yyyy-MM-dd}.txt"));
     }
 }
@@ -1,3 +1,4 @@
+using System.Buffers;
 using System.Security.Cryptography;
 using System.Text;
 using System.Text.Json.Serialization;
@@ -7,6 +8,38 @@ namespace BeszelAgentManager.WinUI.Services;
 
 internal sealed class AgentConfig
 {
+    private static readonly string[] ApplyEnvironmentKeys =
+    [
+        "data_dir",
+        "docker_host",
+        "exclude_containers",
+        "exclude_smart",
+        "extra_filesystems",
+        "filesystem",
+        "intel_gpu_device",
+        "key_file",
+        "token_file",
+        "lhm",
+        "log_level",
+        "mem_calc",
+        "network",
+        "nics",
+        "sensors",
+        "sensors_timeout",
+        "primary_sensor",
+        "sys_sensors",
+        "service_patterns",
+        "smart_devices",
+        "system_name",
+        "skip_gpu",
+        "gpu_collector",
+        "disable_ssh",
+        "nvml",
+        "smart_interval",
+        "disk_usage_cache",
+        "skip_systemd",
+    ];
+
     [JsonPropertyName("key")]
     public string Key { get; set; } = string.Empty;
 
@@ -118,42 +151,13 @@ internal sealed class AgentConfig
             ["hub_url_ip_fallback"] = HubUrlIpFallback,
             ["hub_url_ip_fallback_enabled"] = HubUrlIpFallbackEnabled,
             ["env_active_names"] = string.Join("|", EnvActiveNames.Select(static name => name.Trim()).Where(static name => name.Length > 0).Order(StringComparer.OrdinalIgnoreCase)),
-            ["env_custom"] = string.Join(
-                "|",
-                EnvCustom
-                    .Where(static item => !string.IsNullOrWhiteSpace(item.Name))
-                    .OrderBy(static item => item.Name, StringComparer.OrdinalIgnoreCase)
-                    .Select(static item => $"{item.Name.Trim()}={item.Value}")),
+            ["env_custom"] = CustomEnvironmentFingerprint(),
         };
 
-        AddExtra("data_dir");
-        AddExtra("docker_host");
-        AddExtra("exclude_containers");
-        AddExtra("exclude_smart");
-        AddExtra("extra_filesystems");
-        AddExtra("filesystem");
-        AddExtra("intel_gpu_device");
-        AddExtra("key_file");
-        AddExtra("token_file");
-        AddExtra("lhm");
-        AddExtra("log_level");
-        AddExtra("mem_calc");
-        AddExtra("network");
-        AddExtra("nics");
-        AddExtra("sensors");
-        AddExtra("sensors_timeout");
-        AddExtra("primary_sensor");
-        AddExtra("sys_sensors");
-        AddExtra("service_patterns");
-        AddExtra("smart_devices");
-        AddExtra("system_name");
-        AddExtra("skip_gpu");
-        AddExtra("gpu_collector");
-        AddExtra("disable_ssh");
-        AddExtra("nvml");
-        AddExtra("smart_interval");
-        AddExtra("disk_usage_cache");
-        AddExtra("skip_systemd");
+        foreach (var key in ApplyEnvironmentKeys)
+        {
+            values[key] = GetEnvironmentValue(key);
+        }
 
         var builder = new StringBuilder();
         foreach (var item in values)
@@ -165,14 +169,33 @@ internal sealed class AgentConfig
                 .Append('\n');
         }
 
-        var payload = builder.ToString();
-        var bytes = SHA256.HashData(Encoding.UTF8.GetBytes(payload));
-        return Convert.ToHexString(bytes).ToLowerInvariant();
+        return HashPayload(builder.ToString());
+    }
 
-        void AddExtra(string key)
+    private string CustomEnvironmentFingerprint()
+    {
+        if (EnvCustom.Count == 0)
         {
-            values[key] = GetEnvironmentValue(key);
+            return string.Empty;
+        }
+
+        var builder = new StringBuilder();
+        foreach (var item in EnvCustom.OrderBy(static item => item.Name, StringComparer.OrdinalIgnoreCase))
+        {
+            if (string.IsNullOrWhiteSpace(item.Name))
+            {
+                continue;
+            }
+
+            if (builder.Length > 0)
+            {
+                builder.Append('|');
+            }
+
+            builder.Append(item.Name.AsSpan().Trim()).Append('=').Append(item.Value);
         }
+
+        return builder.ToString();
     }
 
     public string ManagerTasksFingerprint()
@@ -183,8 +206,24 @@ internal sealed class AgentConfig
             $"auto_restart_enabled={AutoRestartEnabled}\n" +
             $"auto_restart_interval_value={AutoRestartIntervalValue}\n" +
             $"auto_restart_interval_unit={AutoRestartIntervalUnit}\n";
-        var bytes = SHA256.HashData(Encoding.UTF8.GetBytes(payload));
-        return Convert.ToHexString(bytes).ToLowerInvariant();
+        return HashPayload(payload);
+    }
+
+    private static string HashPayload(string payload)
+    {
+        Span<byte> hash = stackalloc byte[SHA256.HashSizeInBytes];
+        var buffer = ArrayPool<byte>.Shared.Rent(Encoding.UTF8.GetMaxByteCount(payload.Length));
+        try
+        {
+            var length = Encoding.UTF8.GetBytes(payload, buffer);
+            SHA256.HashData(buffer.AsSpan(0, length), hash);
+        }
+        finally
+        {
+            ArrayPool<byte>.Shared.Return(buffer);
+        }
+
+        return Convert.ToHexStringLower(hash);
     }
 }
 
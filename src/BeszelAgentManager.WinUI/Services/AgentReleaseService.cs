@@ -1,3 +1,4 @@
+using System.Net;
 using System.Net.Http.Headers;
 using System.Text.Json;
 
@@ -7,34 +8,153 @@ internal sealed class AgentReleaseService
 {
     private const string AgentRepo = "henrygd/beszel";
     private const string AgentAssetName = "beszel-agent_windows_amd64.zip";
+    private static readonly TimeSpan CacheLifetime = TimeSpan.FromMinutes(10);
+    private static readonly SemaphoreSlim CacheLock = new(1, 1);
+    private static ReleaseCache? _cache;
+    private static bool _diskCacheLoaded;
     private readonly HttpClient _httpClient = new();
     private readonly GitHubTokenService _gitHubTokenService = new();
 
-    public async Task<IReadOnlyList<AgentRelease>> FetchStableReleasesAsync(CancellationToken cancellationToken = default)
+    public Task<IReadOnlyList<AgentRelease>> FetchStableReleasesAsync(CancellationToken cancellationToken = default)
     {
-        using var request = new HttpRequestMessage(
-            HttpMethod.Get,
-            $"https://api.github.com/repos/{AgentRepo}/releases?per_page=50");
-        await ApplyGitHubHeadersAsync(request, cancellationToken);
-
-        using var response = await _httpClient.SendAsync(request, cancellationToken);
-        LogGitHubAuthSuccess(response);
-        response.EnsureSuccessStatusCode();
-
-        await using var stream = await response.Content.ReadAsStreamAsync(cancellationToken);
-        using var document = await JsonDocument.ParseAsync(stream, cancellationToken: cancellationToken);
-        if (document.RootElement.ValueKind != JsonValueKind.Array)
+        return Task.Run(() => FetchStableReleasesCoreAsync(cancellationToken), cancellationToken);
+    }
+
+    private async Task<IReadOnlyList<AgentRelease>> FetchStableReleasesCoreAsync(CancellationToken cancellationToken)
+    {
+        await CacheLock.WaitAsync(cancellationToken);
+        try
+        {
+            if (!_diskCacheLoaded)
+            {
+                _diskCacheLoaded = true;
+                _cache ??= LoadDiskCache();
+            }
+
+            if (_cache is { } cached && DateTime.UtcNow - cached.FetchedAtUtc < CacheLifetime)
+            {
+                return cached.Releases;
+            }
+
+            using var request = new HttpRequestMessage(
+                HttpMethod.Get,
+                $"https://api.github.com/repos/{AgentRepo}/releases?per_page=50");
+            await ApplyGitHubHeadersAsync(request, cancellationToken);
+            if (!string.IsNullOrWhiteSpace(_cache?.ETag))
+            {
+                request.Headers.TryAddWithoutValidation("If-None-Match", _cache.ETag);
+            }
+
+            using var response = await _httpClient.SendAsync(request, cancellationToken);
+            LogGitHubAuthSuccess(response);
+            if (response.StatusCode == HttpStatusCode.NotModified && _cache is not null)
+            {
+                _cache = _cache with { FetchedAtUtc = DateTime.UtcNow };
+                SaveDiskCache(_cache);
+                return _cache.Releases;
+            }
+
+            response.EnsureSuccessStatusCode();
+
+            await using var stream = await response.Content.ReadAsStreamAsync(cancellationToken);
+            using var document = await JsonDocument.ParseAsync(stream, cancellationToken: cancellationToken);
+            if (document.RootElement.ValueKind != JsonValueKind.Array)
+            {
+                return [];
+            }
+
+            var releases = document.RootElement
+                .EnumerateArray()
+                .Select(ParseRelease)
+                .Where(static release => release is not null)
+                .Select(static release => release!)
+                .OrderByDescending(static release => ToVersionKey(release.Version))
+                .ToList();
+            _cache = new ReleaseCache(response.Headers.ETag?.ToString(), DateTime.UtcNow, releases);
+            SaveDiskCache(_cache);
+            return releases;
+        }
+        finally
+        {
+            CacheLock.Release();
+        }
+    }
+
+    private static ReleaseCache? LoadDiskCache()
+    {
+        try
         {
-            return [];
+            if (!File.Exists(ManagerPaths.AgentReleaseCachePath))
+            {
+                return null;
+            }
+
+            using var stream = File.OpenRead(ManagerPaths.AgentReleaseCachePath);
+            using var document = JsonDocument.Parse(stream);
+            var root = document.RootElement;
+            if (root.ValueKind != JsonValueKind.Object
+                || !root.TryGetProperty("releases", out var items)
+                || items.ValueKind != JsonValueKind.Array)
+            {
+                return null;
+            }
+
+            var releases = items
+                .EnumerateArray()
+                .Select(static item => new AgentRelease(
+                    GetString(item, "version"),
+                    GetString(item, "tag"),
+                    GetString(item, "body")))
+                .Where(static release => !string.IsNullOrWhiteSpace(release.Version))
+                .ToList();
+            var etag = GetString(root, "etag");
+            return new ReleaseCache(
+                etag.Length > 0 ? etag : null,
+                root.TryGetProperty("fetched_at", out var fetchedAt) && fetchedAt.TryGetDateTime(out var parsed)
+                    ? parsed
+                    : DateTime.MinValue,
+                releases);
         }
+        catch (Exception ex)
+        {
+            App.Logger.Debug($"Could not read agent release cache: {ex.Message}");
+            return null;
+        }
+    }
 
-        return document.RootElement
-            .EnumerateArray()
-            .Select(ParseRelease)
-            .Where(static release => release is not null)
-            .Select(static release => release!)
-            .OrderByDescending(static release => ToVersionKey(release.Version))
-            .ToList();
+    private static void SaveDiskCache(ReleaseCache cache)
+    {
+        var path = ManagerPaths.AgentReleaseCachePath;
+        var temporaryPath = $"{path}.{Environment.ProcessId}.tmp";
+        try
+        {
+            Directory.CreateDirectory(Path.GetDirectoryName(path)!);
+            using (var stream = File.Create(temporaryPath))
+            using (var writer = new Utf8JsonWriter(stream))
+            {
+                writer.WriteStartObject();
+                writer.WriteString("etag", cache.ETag);
+                writer.WriteString("fetched_at", cache.FetchedAtUtc);
+                writer.WriteStartArray("releases");
+                foreach (var release in cache.Releases)
+                {
+                    writer.WriteStartObject();
+                    writer.WriteString("version", release.Version);
+                    writer.WriteString("tag", release.Tag);
+                    writer.WriteString("body", release.Body);
+                    writer.WriteEndObject();
+                }
+
+                writer.WriteEndArray();
+                writer.WriteEndObject();
+            }
+
+            File.Move(temporaryPath, path, overwrite: true);
+        }
+        catch (Exception ex)
+        {
+            App.Logger.Debug($"Could not write agent release cache: {ex.Message}");
+        }
     }
 
     private static AgentRelease? ParseRelease(JsonElement element)
@@ -111,3 +231,5 @@ internal sealed class AgentReleaseService
 }
 
 internal sealed record AgentRelease(string Version, string Tag, string Body);
+
+internal sealed record ReleaseCache(string? ETag, DateTime FetchedAtUtc, IReadOnlyList<AgentRelease> Releases);
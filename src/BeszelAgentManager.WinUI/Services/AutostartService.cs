@@ -5,6 +5,7 @@ namespace BeszelAgentManager.WinUI.Services;
 internal sealed class AutostartService
 {
     private const string RunKeyPath = @"Software\Microsoft\Windows\CurrentVersion\Run";
+    private static (bool Enabled, bool StartHidden)? _cachedState;
 
     public bool MigrateLegacyInstallTarget()
     {
@@ -39,24 +40,39 @@ internal sealed class AutostartService
         }
 
         key!.SetValue(AppInfo.ProjectName, migrated, RegistryValueKind.String);
+        _cachedState = null;
         return true;
     }
 
     public (bool Enabled, bool StartHidden) GetState()
     {
+        if (_cachedState is { } cached)
+        {
+            return cached;
+        }
+
         using var key = Registry.CurrentUser.OpenSubKey(RunKeyPath);
         var command = key?.GetValue(AppInfo.ProjectName)?.ToString() ?? string.Empty;
-        return (
+        var state = (
             !string.IsNullOrWhiteSpace(command),
             command.Contains("--hidden", StringComparison.OrdinalIgnoreCase));
+        _cachedState = state;
+        return state;
     }
 
     public void SetState(bool enabled, bool startHidden)
     {
+        _cachedState = null;
         using var key = Registry.CurrentUser.CreateSubKey(RunKeyPath, writable: true);
+        var current = key.GetValue(AppInfo.ProjectName)?.ToString();
         if (!enabled)
         {
-            key.DeleteValue(AppInfo.ProjectName, throwOnMissingValue: false);
+            if (current is not null)
+            {
+                key.DeleteValue(AppInfo.ProjectName, throwOnMissingValue: false);
+            }
+
+            _cachedState = (false, false);
             return;
         }
 
@@ -68,7 +84,12 @@ internal sealed class AutostartService
             command += " --hidden";
         }
 
-        key.SetValue(AppInfo.ProjectName, command, RegistryValueKind.String);
+        if (!string.Equals(current, command, StringComparison.Ordinal))
+        {
+            key.SetValue(AppInfo.ProjectName, command, RegistryValueKind.String);
+        }
+
+        _cachedState = (true, startHidden);
     }
 
     private static bool CommandTargets(string command, string executable)
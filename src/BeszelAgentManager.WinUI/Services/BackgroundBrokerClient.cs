@@ -11,6 +11,7 @@ internal sealed class BackgroundBrokerClient
 {
     private const string PipeName = "BeszelAgentManager.Background.v1";
     private const int ProtocolVersion = 1;
+    private static string? _helperPath;
     private readonly SemaphoreSlim _gate = new(1, 1);
 
     public Task<int> RunServiceActionAsync(string action)
@@ -141,9 +142,18 @@ internal sealed class BackgroundBrokerClient
 
     private static string GetHelperPath()
     {
+        if (_helperPath is not null)
+        {
+            return _helperPath;
+        }
+
         var helperPath = Path.Combine(AppContext.BaseDirectory, "helper", "BeszelAgentManager.Helper.exe");
-        return File.Exists(helperPath)
-            ? helperPath
-            : throw new FileNotFoundException("The privileged helper is not present in the application folder.", helperPath);
+        if (!File.Exists(helperPath))
+        {
+            throw new FileNotFoundException("The privileged helper is not present in the application folder.", helperPath);
+        }
+
+        _helperPath = helperPath;
+        return helperPath;
     }
 }
@@ -48,7 +48,7 @@ internal sealed class ConfigService
             Directory.CreateDirectory(ManagerPaths.DataDir);
             await File.WriteAllTextAsync(
                 ManagerPaths.ConfigPath,
-                config.ToJsonString(new JsonSerializerOptions { WriteIndented = true }),
+                config.ToJsonString(),
                 cancellationToken);
         }
         catch (UnauthorizedAccessException)
@@ -57,7 +57,7 @@ internal sealed class ConfigService
             Directory.CreateDirectory(Path.GetDirectoryName(ManagerPaths.LocalSettingsPath)!);
             await File.WriteAllTextAsync(
                 ManagerPaths.LocalSettingsPath,
-                local.ToJsonString(new JsonSerializerOptions { WriteIndented = true }),
+                local.ToJsonString(),
                 cancellationToken);
         }
     }
@@ -97,14 +97,15 @@ internal sealed class ConfigService
 
     public IReadOnlyList<(string Name, string ConfigKey, string Value)> GetActiveEnvironmentRows(AgentConfig config)
     {
-        var rows = new List<(string Name, string ConfigKey, string Value)>();
-        var activeNames = config.EnvActiveNames
-            .Where(static name => !string.IsNullOrWhiteSpace(name))
-            .Distinct(StringComparer.OrdinalIgnoreCase)
-            .ToList();
-
-        foreach (var envName in activeNames)
+        var rows = new List<(string Name, string ConfigKey, string Value)>(config.EnvActiveNames.Count + config.EnvCustom.Count);
+        var seenNames = new HashSet<string>(StringComparer.OrdinalIgnoreCase);
+        foreach (var envName in config.EnvActiveNames)
         {
+            if (string.IsNullOrWhiteSpace(envName) || !seenNames.Add(envName))
+            {
+                continue;
+            }
+
             var configKey = EnvNameToConfigKey(envName);
             var value = config.GetEnvironmentValue(configKey);
             rows.Add((envName, configKey, value));
@@ -125,43 +126,30 @@ internal sealed class ConfigService
 
     private static AgentConfig Normalize(AgentConfig config)
     {
-        return new AgentConfig
-        {
-            Key = config.Key ?? string.Empty,
-            Token = config.Token ?? string.Empty,
-            HubUrl = config.HubUrl ?? string.Empty,
-            HubUrlIpFallback = config.HubUrlIpFallback ?? string.Empty,
-            HubUrlIpFallbackEnabled = config.HubUrlIpFallbackEnabled,
-            Listen = config.Listen,
-            EnvActiveNames = config.EnvActiveNames ?? [],
-            EnvCustom = config.EnvCustom ?? [],
-            AutoUpdateEnabled = config.AutoUpdateEnabled,
-            UpdateIntervalHours = config.UpdateIntervalHours > 0 ? Math.Clamp(config.UpdateIntervalHours, 1, 720) : 24,
-            AutoRestartEnabled = config.AutoRestartEnabled,
-            AutoRestartIntervalHours = config.AutoRestartIntervalHours > 0 ? config.AutoRestartIntervalHours : 24,
-            AutoRestartIntervalValue = config.AutoRestartIntervalValue > 0
-                ? config.AutoRestartIntervalValue
-                : config.AutoRestartIntervalHours > 0 ? config.AutoRestartIntervalHours : 24,
-            AutoRestartIntervalUnit = string.Equals(config.AutoRestartIntervalUnit, "minutes", StringComparison.OrdinalIgnoreCase)
-                ? "minutes"
-                : "hours",
-            DebugLogging = config.DebugLogging,
-            GitHubTokenEncrypted = config.GitHubTokenEncrypted ?? string.Empty,
-            StartHidden = config.StartHidden,
-            ManagerUpdateNotifyEnabled = config.ManagerUpdateNotifyEnabled,
-            ManagerUpdateCheckIntervalHours = Math.Clamp(config.ManagerUpdateCheckIntervalHours, 1, 168),
-            ManagerUpdateSkipVersion = config.ManagerUpdateSkipVersion ?? string.Empty,
-            ManagerUpdateTrayBadgeEnabled = config.ManagerUpdateTrayBadgeEnabled,
-            ManagerUpdateIncludePrereleases = config.ManagerUpdateIncludePrereleases,
-            ManagerUpdateLastCheckAt = config.ManagerUpdateLastCheckAt ?? string.Empty,
-            ManagerUpdateLastNotifiedVersion = config.ManagerUpdateLastNotifiedVersion ?? string.Empty,
-            DefenderExclusionEnabled = config.DefenderExclusionEnabled,
-            DefenderExclusionPrompted = config.DefenderExclusionPrompted,
-            LastAppliedFingerprint = config.LastAppliedFingerprint ?? string.Empty,
-            LastAppliedAt = config.LastAppliedAt ?? string.Empty,
-            LastAppliedManagerTasksFingerprint = config.LastAppliedManagerTasksFingerprint ?? string.Empty,
-            ExtraFields = config.ExtraFields ?? [],
-        };
+        config.Key ??= string.Empty;
+        config.Token ??= string.Empty;
+        config.HubUrl ??= string.Empty;
+        config.HubUrlIpFallback ??= string.Empty;
+        config.EnvActiveNames ??= [];
+        config.EnvCustom ??= [];
+        config.UpdateIntervalHours = config.UpdateIntervalHours > 0 ? Math.Clamp(config.UpdateIntervalHours, 1, 720) : 24;
+        config.AutoRestartIntervalValue = config.AutoRestartIntervalValue > 0
+            ? config.AutoRestartIntervalValue
+            : config.AutoRestartIntervalHours > 0 ? config.AutoRestartIntervalHours : 24;
+        config.AutoRestartIntervalHours = config.AutoRestartIntervalHours > 0 ? config.AutoRestartIntervalHours : 24;
+        config.AutoRestartIntervalUnit = string.Equals(config.AutoRestartIntervalUnit, "minutes", StringComparison.OrdinalIgnoreCase)
+            ? "minutes"
+            : "hours";
+        config.GitHubTokenEncrypted ??= string.Empty;
+        config.ManagerUpdateCheckIntervalHours = Math.Clamp(config.ManagerUpdateCheckIntervalHours, 1, 168);
+        config.ManagerUpdateSkipVersion ??= string.Empty;
+        config.ManagerUpdateLastCheckAt ??= string.Empty;
+        config.ManagerUpdateLastNotifiedVersion ??= string.Empty;
+        config.LastAppliedFingerprint ??= string.Empty;
+        config.LastAppliedAt ??= string.Empty;
+        config.LastAppliedManagerTasksFingerprint ??= string.Empty;
+        config.ExtraFields ??= [];
+        return config;
     }
 
     private static async Task<AgentConfig> ApplyLocalOverridesAsync(AgentConfig config, CancellationToken cancellationToken)
@@ -6,7 +6,13 @@ internal sealed record HubStatus(bool IsConfigured, bool IsReachable, int? Laten
 
 internal sealed class HubStatusService
 {
-    private readonly HttpClient _httpClient = new()
+    private static readonly HttpClient HttpClient = new(new SocketsHttpHandler
+    {
+        ConnectTimeout = TimeSpan.FromSeconds(5),
+        MaxConnectionsPerServer = 1,
+        PooledConnectionIdleTimeout = TimeSpan.FromMinutes(2),
+        PooledConnectionLifetime = TimeSpan.FromMinutes(10),
+    })
     {
         Timeout = TimeSpan.FromSeconds(5),
     };
@@ -23,7 +29,7 @@ internal sealed class HubStatusService
         {
             using var request = new HttpRequestMessage(HttpMethod.Head, url);
             var stopwatch = Stopwatch.StartNew();
-            using var response = await _httpClient.SendAsync(request, HttpCompletionOption.ResponseHeadersRead, cancellationToken);
+            using var response = await HttpClient.SendAsync(request, HttpCompletionOption.ResponseHeadersRead, cancellationToken);
             stopwatch.Stop();
             return new HubStatus(true, true, (int)stopwatch.ElapsedMilliseconds, url);
         }
@@ -1,13 +1,21 @@
+using System.Text;
+using BeszelAgentManager.Core;
+
 namespace BeszelAgentManager.WinUI.Services;
 
 internal sealed class LogReaderService
 {
+    private const int RecentReadLimit = 4;
+    private readonly List<(string Key, LogReadResult Read)> _recentReads = [];
+
     public IReadOnlyList<LogFileItem> ListManagerLogFiles()
     {
         var files = new List<LogFileItem>();
+        var seenPaths = new HashSet<string>(StringComparer.OrdinalIgnoreCase);
         if (File.Exists(ManagerPaths.ManagerLogPath))
         {
             files.Add(new LogFileItem("Current (manager.log)", ManagerPaths.ManagerLogPath));
+            seenPaths.Add(ManagerPaths.ManagerLogPath);
         }
 
         var archiveDirs = new[]
@@ -22,7 +30,7 @@ internal sealed class LogReaderService
             {
                 files.AddRange(Directory
                     .EnumerateFiles(archiveDir, "manager-*.txt")
-                    .Where(path => !files.Any(existing => string.Equals(existing.Path, path, StringComparison.OrdinalIgnoreCase)))
+                    .Where(seenPaths.Add)
                     .OrderByDescending(File.GetLastWriteTime)
                     .Select(path => new LogFileItem(Path.GetFileName(path), path)));
             }
@@ -47,9 +55,10 @@ internal sealed class LogReaderService
                 .OrderByDescending(File.GetLastWriteTime)
                 .Select(path => new LogFileItem(Path.GetFileName(path), path)));
 
+            var seenPaths = new HashSet<string>(files.Select(static file => file.Path), StringComparer.OrdinalIgnoreCase);
             files.AddRange(Directory
                 .EnumerateFiles(agentLogDir, "beszel-agent-*.log")
-                .Where(path => !files.Any(existing => string.Equals(existing.Path, path, StringComparison.OrdinalIgnoreCase)))
+                .Where(seenPaths.Add)
                 .OrderByDescending(File.GetLastWriteTime)
                 .Select(path => new LogFileItem(Path.GetFileName(path), path)));
         }
@@ -57,42 +66,86 @@ internal sealed class LogReaderService
         return files;
     }
 
-    public async Task<string> ReadAllAsync(string path, string typeFilter = "All", CancellationToken cancellationToken = default)
+    public async Task<LogReadResult> ReadLastLinesAsync(
+        string path,
+        string typeFilter = "All",
+        int maxLines = 500,
+        long maxBytes = long.MaxValue,
+        CancellationToken cancellationToken = default)
     {
-        if (!File.Exists(path))
+        var file = new FileInfo(path);
+        if (!file.Exists)
         {
-            return $"Log file not found: {path}";
+            return LogReadResult.Message($"Log file not found: {path}");
+        }
+
+        var key = $"{path}|{typeFilter}|{maxLines}|{maxBytes}";
+        var cachedIndex = _recentReads.FindIndex(read =>
+            string.Equals(read.Key, key, StringComparison.OrdinalIgnoreCase)
+            && read.Read.Length == file.Length
+            && read.Read.WriteTimeUtc == file.LastWriteTimeUtc);
+        if (cachedIndex >= 0)
+        {
+            var cached = _recentReads[cachedIndex];
+            _recentReads.RemoveAt(cachedIndex);
+            _recentReads.Add(cached);
+            return cached.Read;
         }
 
         try
         {
-            using var stream = new FileStream(path, FileMode.Open, FileAccess.Read, FileShare.ReadWrite | FileShare.Delete);
-            using var reader = new StreamReader(stream);
-            var content = await reader.ReadToEndAsync(cancellationToken);
-            if (string.IsNullOrEmpty(content))
+            var read = await Task.Run(
+                () => ReadLastLinesCoreAsync(path, typeFilter, maxLines, maxBytes, cancellationToken),
+                cancellationToken);
+            _recentReads.RemoveAll(entry => string.Equals(entry.Key, key, StringComparison.OrdinalIgnoreCase));
+            _recentReads.Add((key, read));
+            if (_recentReads.Count > RecentReadLimit)
             {
-                return $"Log file is empty: {path}";
+                _recentReads.RemoveAt(0);
             }
 
-            return FilterLogText(content, typeFilter);
+            return read;
         }
         catch (Exception ex)
         {
-            return $"Could not read log file: {path}{Environment.NewLine}{ex.Message}";
+            return LogReadResult.Message($"Could not read log file: {path}{Environment.NewLine}{ex.Message}");
         }
     }
 
-    public async Task<string> ReadTailAsync(
+    private static async Task<LogReadResult> ReadLastLinesCoreAsync(
         string path,
-        int maxLines = 500,
-        int maxBytes = 128 * 1024,
-        CancellationToken cancellationToken = default)
+        string typeFilter,
+        int maxLines,
+        long maxBytes,
+        CancellationToken cancellationToken)
     {
-        if (!File.Exists(path))
+        using var stream = new FileStream(
+            path,
+            FileMode.Open,
+            FileAccess.Read,
+            FileShare.ReadWrite | FileShare.Delete,
+            bufferSize: 64 * 1024,
+            useAsync: true);
+        var writeTimeUtc = File.GetLastWriteTimeUtc(stream.SafeFileHandle);
+        if (stream.Length == 0)
         {
-            return $"Log file not found: {path}";
+            return new LogReadResult($"Log file is empty: {path}", 0, writeTimeUtc, false);
         }
 
+        var needle = FilterNeedle(typeFilter);
+        var tail = await LogTailReader.ReadLastLinesAsync(stream, needle, maxLines, maxBytes, cancellationToken);
+        var text = tail.Lines.Count == 0 && needle.Length > 0
+            ? $"No {typeFilter.ToLowerInvariant()} entries in selected log."
+            : string.Join(Environment.NewLine, tail.Lines);
+        return new LogReadResult(text, tail.Length, writeTimeUtc, tail.EndsWithNewline);
+    }
+
+    public async Task<LogReadResult?> ReadAppendedAsync(
+        string path,
+        long offset,
+        int maxBytes = 128 * 1024,
+        CancellationToken cancellationToken = default)
+    {
         try
         {
             using var stream = new FileStream(
@@ -102,52 +155,33 @@ internal sealed class LogReaderService
                 FileShare.ReadWrite | FileShare.Delete,
                 bufferSize: 16 * 1024,
                 useAsync: true);
-            if (stream.Length > maxBytes)
-            {
-                stream.Seek(-maxBytes, SeekOrigin.End);
-            }
-
-            using var reader = new StreamReader(stream);
-            var content = await reader.ReadToEndAsync(cancellationToken);
-            if (string.IsNullOrEmpty(content))
+            var writeTimeUtc = File.GetLastWriteTimeUtc(stream.SafeFileHandle);
+            var length = stream.Length;
+            if (offset < 0 || length < offset || length - offset > maxBytes)
             {
-                return $"Log file is empty: {path}";
+                return null;
             }
 
-            var lines = content
-                .Replace("\r\n", "\n")
-                .Split('\n')
-                .TakeLast(maxLines)
-                .ToList();
-
-            return lines.Count == 0
-                ? $"Log file is empty: {path}"
-                : string.Join(Environment.NewLine, lines);
+            var buffer = new byte[length - offset];
+            stream.Seek(offset, SeekOrigin.Begin);
+            await stream.ReadExactlyAsync(buffer, cancellationToken);
+            var text = Encoding.UTF8.GetString(buffer);
+            return new LogReadResult(text, length, writeTimeUtc, text.EndsWith('\n'));
         }
-        catch (Exception ex)
+        catch
         {
-            return $"Could not read log file: {path}{Environment.NewLine}{ex.Message}";
+            return null;
         }
     }
 
-    public async Task<string> ReadTailFilteredAsync(
-        string path,
-        string typeFilter = "All",
-        int maxLines = 500,
-        CancellationToken cancellationToken = default)
-    {
-        var content = await ReadTailAsync(path, maxLines, cancellationToken: cancellationToken);
-        return FilterLogText(content, typeFilter);
-    }
-
-    private static string FilterLogText(string content, string typeFilter)
+    private static string FilterNeedle(string typeFilter)
     {
         if (string.IsNullOrWhiteSpace(typeFilter) || string.Equals(typeFilter, "All", StringComparison.OrdinalIgnoreCase))
         {
-            return content;
+            return string.Empty;
         }
 
-        var needle = typeFilter.Trim().ToLowerInvariant() switch
+        return typeFilter.Trim().ToLowerInvariant() switch
         {
             "info" => "info",
             "warning" => "warn",
@@ -158,20 +192,10 @@ internal sealed class LogReaderService
             "task" => "task",
             _ => string.Empty,
         };
-
-        if (string.IsNullOrEmpty(needle))
-        {
-            return content;
-        }
-
-        var filtered = content
-            .Replace("\r\n", "\n")
-            .Split('\n')
-            .Where(line => line.Contains(needle, StringComparison.OrdinalIgnoreCase))
-            .ToList();
-
-        return filtered.Count == 0
-            ? $"No {typeFilter.ToLowerInvariant()} entries in selected log."
-            : string.Join(Environment.NewLine, filtered);
     }
 }
+
+internal sealed record LogReadResult(string Text, long Length, DateTime WriteTimeUtc, bool EndsWithNewline)
+{
+    public static LogReadResult Message(string text) => new(text, -1, DateTime.MinValue, false);
+}
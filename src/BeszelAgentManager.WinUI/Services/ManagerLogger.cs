@@ -1,13 +1,21 @@
+using System.Runtime.CompilerServices;
+
 namespace BeszelAgentManager.WinUI.Services;
 
 internal sealed class ManagerLogger
 {
     private readonly SemaphoreSlim _writeLock = new(1, 1);
+    private DateTime _rotationCheckedFor;
 
     public bool DebugEnabled { get; private set; }
 
     public void SetDebugEnabled(bool enabled)
     {
+        if (DebugEnabled == enabled)
+        {
+            return;
+        }
+
         DebugEnabled = enabled;
         Info($"Debug logging set to {enabled}");
     }
@@ -22,6 +30,14 @@ internal sealed class ManagerLogger
         }
     }
 
+    public void Debug([InterpolatedStringHandlerArgument("")] ref DebugMessageHandler message)
+    {
+        if (message.Enabled)
+        {
+            _ = WriteAsync("DEBUG", message.ToStringAndClear());
+        }
+    }
+
     public void Warning(string message) => _ = WriteAsync("WARN", message);
 
     public void Error(string message) => _ = WriteAsync("ERROR", message);
@@ -31,14 +47,20 @@ internal sealed class ManagerLogger
         await _writeLock.WaitAsync();
         try
         {
-            Directory.CreateDirectory(ManagerPaths.ManagerLogDir);
-            RotateIfNeeded();
+            if (_rotationCheckedFor != DateTime.Today)
+            {
+                Directory.CreateDirectory(ManagerPaths.ManagerLogDir);
+                RotateIfNeeded();
+                _rotationCheckedFor = DateTime.Today;
+            }
+
             var line = $"{DateTime.Now:yyyy/MM/dd HH:mm:ss} {level} {message}{Environment.NewLine}";
             await File.AppendAllTextAsync(ManagerPaths.ManagerLogPath, line);
         }
         catch
         {
             // Logging must never block or crash the UI.
+            _rotationCheckedFor = default;
         }
         finally
         {
@@ -72,10 +94,39 @@ internal sealed class ManagerLogger
         {
             Directory.CreateDirectory(archiveDir);
             var archivePath = Path.Combine(archiveDir, $"manager-{lastDate:yyyy-MM-dd}.txt");
-            File.AppendAllText(archivePath, File.ReadAllText(ManagerPaths.ManagerLogPath));
-            File.WriteAllText(ManagerPaths.ManagerLogPath, string.Empty);
+            ArchiveCurrentLog(archivePath);
         }
 
         File.WriteAllText(markerPath, today.ToString("yyyy-MM-dd"));
     }
+
+    public static void ArchiveCurrentLog(string archivePath)
+    {
+        using var source = new FileStream(ManagerPaths.ManagerLogPath, FileMode.Open, FileAccess.ReadWrite, FileShare.ReadWrite);
+        using var target = new FileStream(archivePath, FileMode.Append, FileAccess.Write, FileShare.Read);
+        source.CopyTo(target);
+        source.SetLength(0);
+    }
+
+    [InterpolatedStringHandler]
+    public ref struct DebugMessageHandler
+    {
+        private DefaultInterpolatedStringHandler _builder;
+
+        public DebugMessageHandler(int literalLength, int formattedCount, ManagerLogger logger, out bool enabled)
+        {
+            Enabled = enabled = logger.DebugEnabled;
+            _builder = enabled ? new DefaultInterpolatedStringHandler(literalLength, formattedCount) : default;
+        }
+
+        public bool Enabled { get; }
+
+        public void AppendLiteral(string value) => _builder.AppendLiteral(value);
+
+        public void AppendFormatted<T>(T value) => _builder.AppendFormatted(value);
+
+        public void AppendFormatted<T>(T value, string? format) => _builder.AppendFormatted(value, format);
+
+        internal string ToStringAndClear() => _builder.ToStringAndClear();
+    }
 }
@@ -4,25 +4,29 @@ internal static class ManagerPaths
 {
     private static readonly Lazy<string> WritableManagerLogPath = new(ResolveWritableManagerLogPath);
 
-    public static string ProgramFiles => Environment.GetFolderPath(Environment.SpecialFolder.ProgramFiles);
-    public static string ProgramData => Environment.GetFolderPath(Environment.SpecialFolder.CommonApplicationData);
+    public static string ProgramFiles { get; } = Environment.GetFolderPath(Environment.SpecialFolder.ProgramFiles);
+    public static string ProgramData { get; } = Environment.GetFolderPath(Environment.SpecialFolder.CommonApplicationData);
 
-    public static string InstallDir => Path.Combine(ProgramFiles, AppInfo.ProjectName);
-    public static string DataDir => Path.Combine(ProgramData, AppInfo.ProjectName);
-    public static string ConfigPath => Path.Combine(DataDir, "config.json");
-    public static string HelperLastErrorPath => Path.Combine(DataDir, "helper-last-error.txt");
-    public static string DnsFallbackStatePath => Path.Combine(DataDir, "dns-fallback-state.json");
+    public static string InstallDir { get; } = Path.Combine(ProgramFiles, AppInfo.ProjectName);
+    public static string DataDir { get; } = Path.Combine(ProgramData, AppInfo.ProjectName);
+    public static string ConfigPath { get; } = Path.Combine(DataDir, "config.json");
+    public static string HelperLastErrorPath { get; } = Path.Combine(DataDir, "helper-last-error.txt");
+    public static string DnsFallbackStatePath { get; } = Path.Combine(DataDir, "dns-fallback-state.json");
     public static string ManagerLogPath => WritableManagerLogPath.Value;
     public static string ManagerLogDir => Path.GetDirectoryName(ManagerLogPath) ?? DataDir;
     public static string ManagerLogArchiveDir => Path.Combine(ManagerLogDir, "manager_logs");
-    public static string LocalSettingsPath => Path.Combine(
+    public static string LocalSettingsPath { get; } = Path.Combine(
         Environment.GetFolderPath(Environment.SpecialFolder.LocalApplicationData),
         AppInfo.ProjectName,
         "ui-settings.json");
+    public static string AgentReleaseCachePath { get; } = Path.Combine(
+        Environment.GetFolderPath(Environment.SpecialFolder.LocalApplicationData),
+        AppInfo.ProjectName,
+        "agent-releases-cache.json");
 
-    public static string AgentDir => Path.Combine(ProgramFiles, "Beszel-Agent");
-    public static string AgentExePath => Path.Combine(AgentDir, "beszel-agent.exe");
-    public static string AgentLogPath => Path.Combine(DataDir, "agent_logs", "beszel-agent.log");
+    public static string AgentDir { get; } = Path.Combine(ProgramFiles, "Beszel-Agent");
+    public static string AgentExePath { get; } = Path.Combine(AgentDir, "beszel-agent.exe");
+    public static string AgentLogPath { get; } = Path.Combine(DataDir, "agent_logs", "beszel-agent.log");
 
     private static string ResolveWritableManagerLogPath()
     {
@@ -1,3 +1,4 @@
+using System.Net;
 using System.Net.Http.Headers;
 using System.Text.Json;
 
@@ -5,39 +6,80 @@ namespace BeszelAgentManager.WinUI.Services;
 
 internal sealed class ManagerUpdateService
 {
+    private static readonly TimeSpan CacheLifetime = TimeSpan.FromMinutes(5);
+    private static readonly SemaphoreSlim CacheLock = new(1, 1);
+    private static ManagerReleaseCache? _cache;
     private readonly HttpClient _httpClient = new();
     private readonly GitHubTokenService _gitHubTokenService = new();
 
-    public async Task<ManagerRelease?> FetchLatestReleaseAsync(bool includePrereleases, CancellationToken cancellationToken = default)
+    public async Task<ManagerRelease?> FetchLatestReleaseAsync(
+        bool includePrereleases,
+        bool forceRevalidate = false,
+        CancellationToken cancellationToken = default)
     {
-        var releases = await FetchReleasesAsync(includePrereleases, cancellationToken);
+        var releases = await FetchReleasesAsync(includePrereleases, forceRevalidate, cancellationToken);
         return releases.FirstOrDefault();
     }
 
-    public async Task<IReadOnlyList<ManagerRelease>> FetchReleasesAsync(bool includePrereleases, CancellationToken cancellationToken = default)
+    public async Task<IReadOnlyList<ManagerRelease>> FetchReleasesAsync(
+        bool includePrereleases,
+        bool forceRevalidate = false,
+        CancellationToken cancellationToken = default)
     {
-        var url = $"https://api.github.com/repos/{AppInfo.ManagerRepo}/releases?per_page=50";
+        var releases = await Task.Run(() => FetchAllReleasesAsync(forceRevalidate, cancellationToken), cancellationToken);
+        return includePrereleases
+            ? releases
+            : releases.Where(static r => !r.IsPrerelease).ToList();
+    }
+
+    private async Task<IReadOnlyList<ManagerRelease>> FetchAllReleasesAsync(bool forceRevalidate, CancellationToken cancellationToken)
+    {
+        await CacheLock.WaitAsync(cancellationToken);
+        try
+        {
+            if (!forceRevalidate && _cache is { } cached && DateTime.UtcNow - cached.FetchedAtUtc < CacheLifetime)
+            {
+                return cached.Releases;
+            }
+
+            var url = $"https://api.github.com/repos/{AppInfo.ManagerRepo}/releases?per_page=50";
+
+            using var request = new HttpRequestMessage(HttpMethod.Get, url);
+            await ApplyGitHubHeadersAsync(request, cancellationToken);
+            if (!string.IsNullOrWhiteSpace(_cache?.ETag))
+            {
+                request.Headers.TryAddWithoutValidation("If-None-Match", _cache.ETag);
+            }
 
-        using var request = new HttpRequestMessage(HttpMethod.Get, url);
-        await ApplyGitHubHeadersAsync(request, cancellationToken);
+            using var response = await _httpClient.SendAsync(request, cancellationToken);
+            LogGitHubAuthSuccess(response);
+            if (response.StatusCode == HttpStatusCode.NotModified && _cache is not null)
+            {
+                _cache = _cache with { FetchedAtUtc = DateTime.UtcNow };
+                return _cache.Releases;
+            }
 
-        using var response = await _httpClient.SendAsync(request, cancellationToken);
-        LogGitHubAuthSuccess(response);
-        response.EnsureSuccessStatusCode();
+            response.EnsureSuccessStatusCode();
 
-        await using var stream = await response.Content.ReadAsStreamAsync(cancellationToken);
-        using var document = await JsonDocument.ParseAsync(stream, cancellationToken: cancellationToken);
+            await using var stream = await response.Content.ReadAsStreamAsync(cancellationToken);
+            using var document = await JsonDocument.ParseAsync(stream, cancellationToken: cancellationToken);
 
-        var releases = document.RootElement.ValueKind == JsonValueKind.Array
-            ? document.RootElement.EnumerateArray().Select(ParseRelease)
-            : new[] { ParseRelease(document.RootElement) };
+            var releases = document.RootElement.ValueKind == JsonValueKind.Array
+                ? document.RootElement.EnumerateArray().Select(ParseRelease)
+                : new[] { ParseRelease(document.RootElement) };
 
-        return releases
-            .Where(static r => r is not null)
-            .Select(static r => r!)
-            .Where(r => includePrereleases || !r.IsPrerelease)
-            .OrderByDescending(r => ToVersionKey(r.Version))
-            .ToList();
+            var sorted = releases
+                .Where(static r => r is not null)
+                .Select(static r => r!)
+                .OrderByDescending(r => ToVersionKey(r.Version))
+                .ToList();
+            _cache = new ManagerReleaseCache(response.Headers.ETag?.ToString(), DateTime.UtcNow, sorted);
+            return sorted;
+        }
+        finally
+        {
+            CacheLock.Release();
+        }
     }
 
     private static ManagerRelease? ParseRelease(JsonElement element)
@@ -142,3 +184,5 @@ internal sealed class ManagerUpdateService
         return index < parts.Length && int.TryParse(parts[index], out var parsed) ? parsed : 0;
     }
 }
+
+internal sealed record ManagerReleaseCache(string? ETag, DateTime FetchedAtUtc, IReadOnlyList<ManagerRelease> Releases);
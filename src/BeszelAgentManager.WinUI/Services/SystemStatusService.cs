@@ -7,18 +7,18 @@ internal sealed partial class SystemStatusService
 {
     private const string AgentServiceName = "Beszel Agent";
     private const string LegacyAgentServiceName = "BeszelAgentManager";
-    private string _cachedAgentVersion = string.Empty;
-    private long _cachedAgentLength = -1;
-    private DateTime _cachedAgentWriteTimeUtc = DateTime.MinValue;
+    private static readonly TimeSpan BinaryPathCacheDuration = TimeSpan.FromSeconds(30);
+    private static readonly string[] AgentVersionArguments = ["--version", "version", "-version"];
+    private static CachedAgentVersion? _cachedAgentVersion;
+    private static CachedBinaryPath? _cachedBinaryPath;
 
     public async Task<AgentStatus> GetAgentStatusAsync(CancellationToken cancellationToken = default)
     {
-        var serviceName = await ResolveServiceNameAsync(cancellationToken);
-        var queryOutput = await RunScAsync(["queryex", serviceName], cancellationToken);
+        var (serviceName, queryOutput) = await QueryServiceAsync(cancellationToken);
         var serviceExists = !DoesNotExist(queryOutput);
         var state = serviceExists ? ParseState(queryOutput) : "Not installed";
         var pid = serviceExists ? ParsePid(queryOutput) : null;
-        var binaryPath = serviceExists ? await GetBinaryPathAsync(serviceName, cancellationToken) : string.Empty;
+        var binaryPath = serviceExists ? await GetCachedBinaryPathAsync(serviceName, cancellationToken) : string.Empty;
         var agentExeExists = File.Exists(ManagerPaths.AgentExePath);
         var agentVersion = agentExeExists
             ? await GetCachedAgentVersionAsync(ManagerPaths.AgentExePath, cancellationToken)
@@ -35,16 +35,30 @@ internal sealed partial class SystemStatusService
             agentVersion);
     }
 
-    private static async Task<string> ResolveServiceNameAsync(CancellationToken cancellationToken)
+    private static async Task<(string ServiceName, string Output)> QueryServiceAsync(CancellationToken cancellationToken)
     {
-        var current = await RunScAsync(["query", AgentServiceName], cancellationToken);
+        var current = await RunScAsync(["queryex", AgentServiceName], cancellationToken);
         if (!DoesNotExist(current))
         {
-            return AgentServiceName;
+            return (AgentServiceName, current);
         }
 
-        var legacy = await RunScAsync(["query", LegacyAgentServiceName], cancellationToken);
-        return DoesNotExist(legacy) ? AgentServiceName : LegacyAgentServiceName;
+        var legacy = await RunScAsync(["queryex", LegacyAgentServiceName], cancellationToken);
+        return DoesNotExist(legacy) ? (AgentServiceName, current) : (LegacyAgentServiceName, legacy);
+    }
+
+    private static async Task<string> GetCachedBinaryPathAsync(string serviceName, CancellationToken cancellationToken)
+    {
+        if (Volatile.Read(ref _cachedBinaryPath) is { } cached
+            && string.Equals(cached.ServiceName, serviceName, StringComparison.Ordinal)
+            && cached.ExpiresUtc > DateTime.UtcNow)
+        {
+            return cached.BinaryPath;
+        }
+
+        var binaryPath = await GetBinaryPathAsync(serviceName, cancellationToken);
+        Volatile.Write(ref _cachedBinaryPath, new CachedBinaryPath(serviceName, binaryPath, DateTime.UtcNow + BinaryPathCacheDuration));
+        return binaryPath;
     }
 
     private static async Task<string> GetBinaryPathAsync(string serviceName, CancellationToken cancellationToken)
@@ -64,7 +78,12 @@ internal sealed partial class SystemStatusService
         return string.Empty;
     }
 
-    private static async Task<string> RunScAsync(string[] args, CancellationToken cancellationToken)
+    private static Task<string> RunScAsync(string[] args, CancellationToken cancellationToken)
+    {
+        return Task.Run(() => RunScCoreAsync(args, cancellationToken), cancellationToken);
+    }
+
+    private static async Task<string> RunScCoreAsync(string[] args, CancellationToken cancellationToken)
     {
         var startInfo = new ProcessStartInfo
         {
@@ -86,10 +105,10 @@ internal sealed partial class SystemStatusService
             return string.Empty;
         }
 
-        var stdout = await process.StandardOutput.ReadToEndAsync(cancellationToken);
-        var stderr = await process.StandardError.ReadToEndAsync(cancellationToken);
+        var stdoutTask = process.StandardOutput.ReadToEndAsync(cancellationToken);
+        var stderrTask = process.StandardError.ReadToEndAsync(cancellationToken);
         await process.WaitForExitAsync(cancellationToken);
-        return $"{stdout}{Environment.NewLine}{stderr}".Trim();
+        return $"{await stdoutTask}{Environment.NewLine}{await stderrTask}".Trim();
     }
 
     private static bool DoesNotExist(string output)
@@ -142,11 +161,13 @@ internal sealed partial class SystemStatusService
 
     private static async Task<string> GetAgentVersionAsync(string path, CancellationToken cancellationToken)
     {
-        foreach (var argument in new[] { "--version", "version", "-version" })
+        foreach (var argument in AgentVersionArguments)
         {
             try
             {
-                var result = await RunProcessAsync(path, [argument], TimeSpan.FromSeconds(3), cancellationToken);
+                var result = await Task.Run(
+                    () => RunProcessAsync(path, [argument], TimeSpan.FromSeconds(3), cancellationToken),
+                    cancellationToken);
                 var match = VersionRegex().Match(result.Output);
                 if (match.Success)
                 {
@@ -162,14 +183,15 @@ internal sealed partial class SystemStatusService
         return GetFileVersion(path);
     }
 
-    private async Task<string> GetCachedAgentVersionAsync(string path, CancellationToken cancellationToken)
+    private static async Task<string> GetCachedAgentVersionAsync(string path, CancellationToken cancellationToken)
     {
         var file = new FileInfo(path);
-        if (!string.IsNullOrWhiteSpace(_cachedAgentVersion)
-            && file.Length == _cachedAgentLength
-            && file.LastWriteTimeUtc == _cachedAgentWriteTimeUtc)
+        if (Volatile.Read(ref _cachedAgentVersion) is { } cached
+            && string.Equals(cached.Path, path, StringComparison.OrdinalIgnoreCase)
+            && file.Length == cached.Length
+            && file.LastWriteTimeUtc == cached.WriteTimeUtc)
         {
-            return _cachedAgentVersion;
+            return cached.Version;
         }
 
         var detectedVersion = await GetAgentVersionAsync(path, cancellationToken);
@@ -190,10 +212,8 @@ internal sealed partial class SystemStatusService
             return detectedVersion;
         }
 
-        _cachedAgentVersion = detectedVersion;
-        _cachedAgentLength = file.Length;
-        _cachedAgentWriteTimeUtc = file.LastWriteTimeUtc;
-        return _cachedAgentVersion;
+        Volatile.Write(ref _cachedAgentVersion, new CachedAgentVersion(path, file.Length, file.LastWriteTimeUtc, detectedVersion));
+        return detectedVersion;
     }
 
     private static async Task<(int ExitCode, string Output)> RunProcessAsync(
@@ -238,4 +258,8 @@ internal sealed partial class SystemStatusService
 
     [GeneratedRegex(@"\b(?<version>\d+\.\d+\.\d+(?:[-+][0-9A-Za-z.-]+)?)\b")]
     private static partial Regex VersionRegex();
+
+    private sealed record CachedBinaryPath(string ServiceName, string BinaryPath, DateTime ExpiresUtc);
+
+    private sealed record CachedAgentVersion(string Path, long Length, DateTime WriteTimeUtc, string Version);
 }
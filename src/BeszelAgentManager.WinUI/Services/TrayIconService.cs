@@ -9,7 +9,17 @@ namespace BeszelAgentManager.WinUI.Services;
 
 internal sealed class TrayIconService : IDisposable
 {
-    private readonly TaskbarIcon _taskbarIcon;
+    private static BitmapImage? _iconSource;
+    private readonly Action _open;
+    private readonly Action _openHub;
+    private readonly Func<Task> _startService;
+    private readonly Func<Task> _stopService;
+    private readonly Func<Task> _restartService;
+    private readonly Func<Task> _updateAgent;
+    private readonly Action _exit;
+    private TaskbarIcon? _taskbarIcon;
+    private bool _disposed;
+    private string? _lastToolTipText;
 
     public TrayIconService(
         Action open,
@@ -20,13 +30,66 @@ internal sealed class TrayIconService : IDisposable
         Func<Task> updateAgent,
         Action exit)
     {
-        var openCommand = new TrayCommand(open);
-        var openHubCommand = new TrayCommand(openHub);
-        var startCommand = new TrayCommand(startService);
-        var stopCommand = new TrayCommand(stopService);
-        var restartCommand = new TrayCommand(restartService);
-        var updateCommand = new TrayCommand(updateAgent);
-        var exitCommand = new TrayCommand(exit);
+        _open = open;
+        _openHub = openHub;
+        _startService = startService;
+        _stopService = stopService;
+        _restartService = restartService;
+        _updateAgent = updateAgent;
+        _exit = exit;
+    }
+
+    public void Create()
+    {
+        _ = EnsureCreated();
+    }
+
+    public void ShowNotification(string title, string message, NotificationIcon icon = NotificationIcon.Info)
+    {
+        EnsureCreated()?.ShowNotification(title, message, icon);
+    }
+
+    public void SetStatus(string serviceState, bool managerUpdateAvailable)
+    {
+        var taskbarIcon = EnsureCreated();
+        if (taskbarIcon is null)
+        {
+            return;
+        }
+
+        var toolTipText = managerUpdateAvailable
+            ? $"BeszelAgentManager ({serviceState}) - Update available"
+            : $"BeszelAgentManager ({serviceState})";
+        if (string.Equals(toolTipText, _lastToolTipText, StringComparison.Ordinal))
+        {
+            return;
+        }
+
+        taskbarIcon.ToolTipText = toolTipText;
+        _lastToolTipText = toolTipText;
+    }
+
+    public void Dispose()
+    {
+        _disposed = true;
+        _taskbarIcon?.Dispose();
+        _taskbarIcon = null;
+    }
+
+    private TaskbarIcon? EnsureCreated()
+    {
+        if (_taskbarIcon is not null || _disposed)
+        {
+            return _taskbarIcon;
+        }
+
+        var openCommand = new TrayCommand(_open);
+        var openHubCommand = new TrayCommand(_openHub);
+        var startCommand = new TrayCommand(_startService);
+        var stopCommand = new TrayCommand(_stopService);
+        var restartCommand = new TrayCommand(_restartService);
+        var updateCommand = new TrayCommand(_updateAgent);
+        var exitCommand = new TrayCommand(_exit);
         var menu = new MenuFlyout { AreOpenCloseAnimationsEnabled = false };
         var openItem = new MenuFlyoutItem
         {
@@ -60,31 +123,15 @@ internal sealed class TrayIconService : IDisposable
         _taskbarIcon = new TaskbarIcon
         {
             ToolTipText = "BeszelAgentManager",
-            IconSource = new BitmapImage(new Uri("ms-appx:///Assets/AppIcon.ico")),
+            IconSource = _iconSource ??= new BitmapImage(new Uri("ms-appx:///Assets/AppIcon.ico")),
             ContextFlyout = menu,
             ContextMenuMode = ContextMenuMode.PopupMenu,
-            LeftClickCommand = new TrayCommand(open),
+            LeftClickCommand = openCommand,
             NoLeftClickDelay = true,
             Visibility = Visibility.Visible,
         };
         _taskbarIcon.ForceCreate(enablesEfficiencyMode: false);
-    }
-
-    public void ShowNotification(string title, string message, NotificationIcon icon = NotificationIcon.Info)
-    {
-        _taskbarIcon.ShowNotification(title, message, icon);
-    }
-
-    public void SetStatus(string serviceState, bool managerUpdateAvailable)
-    {
-        _taskbarIcon.ToolTipText = managerUpdateAvailable
-            ? $"BeszelAgentManager ({serviceState}) - Update available"
-            : $"BeszelAgentManager ({serviceState})";
-    }
-
-    public void Dispose()
-    {
-        _taskbarIcon.Dispose();
+        return _taskbarIcon;
     }
 }
 
@@ -0,0 +1,61 @@
+using BeszelAgentManager.Core;
+using Xunit;
+
+namespace BeszelAgentManager.Core.Tests;
+
+public sealed class LogFolderWatcherTests : IDisposable
+{
+    private readonly string _directory = Directory.CreateTempSubdirectory("beszel-watcher-").FullName;
+
+    [Fact]
+    public void FirstLoadRescansAndSecondLoadWithoutChangesSkips()
+    {
+        using var watcher = new LogFolderWatcher((_directory, "*.txt"));
+
+        Assert.True(watcher.IsComplete);
+        Assert.True(watcher.TakeChanges());
+        Assert.False(watcher.TakeChanges());
+    }
+
+    [Fact]
+    public async Task CreatingMatchingFileMarksFolderChanged()
+    {
+        using var watcher = new LogFolderWatcher((_directory, "*.txt"));
+        watcher.TakeChanges();
+
+        await File.WriteAllTextAsync(Path.Combine(_directory, "other.log"), "ignored", TestContext.Current.CancellationToken);
+        await File.WriteAllTextAsync(Path.Combine(_directory, "2026-01-01.txt"), "log", TestContext.Current.CancellationToken);
+
+        Assert.True(await WaitForChangesAsync(watcher));
+        Assert.False(watcher.TakeChanges());
+    }
+
+    [Fact]
+    public void MissingFolderIsReportedAsIncomplete()
+    {
+        using var watcher = new LogFolderWatcher((Path.Combine(_directory, "missing"), "*"));
+
+        Assert.False(watcher.IsComplete);
+        Assert.Single(watcher.Failures);
+    }
+
+    public void Dispose()
+    {
+        Directory.Delete(_directory, recursive: true);
+    }
+
+    private static async Task<bool> WaitForChangesAsync(LogFolderWatcher watcher)
+    {
+        for (var attempt = 0; attempt < 50; attempt++)
+        {
+            if (watcher.TakeChanges())
+            {
+                return true;
+            }
+
+            await Task.Delay(100, TestContext.Current.CancellationToken);
+        }
+
+        return false;
+    }
+}
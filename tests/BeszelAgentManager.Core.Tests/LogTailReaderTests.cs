@@ -0,0 +1,100 @@
+using System.Text;
+using BeszelAgentManager.Core;
+using Xunit;
+
+namespace BeszelAgentManager.Core.Tests;
+
+public sealed class LogTailReaderTests
+{
+    [Fact]
+    public async Task ZeroMaxLinesReturnsNoLines()
+    {
+        using var stream = Open("one\ntwo\n");
+
+        var tail = await LogTailReader.ReadLastLinesAsync(stream, string.Empty, 0, cancellationToken: TestContext.Current.CancellationToken);
+
+        Assert.Empty(tail.Lines);
+        Assert.Equal(stream.Length, tail.Length);
+    }
+
+    [Fact]
+    public async Task OneMaxLineReturnsLastLine()
+    {
+        using var stream = Open("one\ntwo\nthree\n");
+
+        var tail = await LogTailReader.ReadLastLinesAsync(stream, string.Empty, 1, cancellationToken: TestContext.Current.CancellationToken);
+
+        Assert.Equal("three", Assert.Single(tail.Lines));
+        Assert.True(tail.EndsWithNewline);
+    }
+
+    [Fact]
+    public async Task MissingTrailingNewlineKeepsPartialLastLine()
+    {
+        using var stream = Open("one\ntwo");
+
+        var tail = await LogTailReader.ReadLastLinesAsync(stream, string.Empty, 10, cancellationToken: TestContext.Current.CancellationToken);
+
+        Assert.Equal(new[] { "one", "two" }, tail.Lines);
+        Assert.False(tail.EndsWithNewline);
+        Assert.Equal(7, tail.Length);
+    }
+
+    [Fact]
+    public async Task ByteCapInsideLineDropsPartialFirstLine()
+    {
+        using var stream = Open("first line\nsecond\nthird\n");
+
+        var tail = await LogTailReader.ReadLastLinesAsync(stream, string.Empty, 10, maxBytes: 16, TestContext.Current.CancellationToken);
+
+        Assert.Equal(new[] { "second", "third" }, tail.Lines);
+        Assert.Equal(stream.Length, tail.Length);
+    }
+
+    [Fact]
+    public async Task ByteCapOnLineBoundaryKeepsWholeLine()
+    {
+        using var stream = Open("first\nsecond\nthird\n");
+
+        var tail = await LogTailReader.ReadLastLinesAsync(stream, string.Empty, 10, maxBytes: 13, TestContext.Current.CancellationToken);
+
+        Assert.Equal(new[] { "second", "third" }, tail.Lines);
+    }
+
+    [Fact]
+    public async Task CrlfLinesAreReturnedWithoutCarriageReturns()
+    {
+        using var stream = Open("one\r\ntwo\r\nthree\r\n");
+
+        var tail = await LogTailReader.ReadLastLinesAsync(stream, string.Empty, 2, maxBytes: 12, TestContext.Current.CancellationToken);
+
+        Assert.Equal(new[] { "two", "three" }, tail.Lines);
+        Assert.True(tail.EndsWithNewline);
+    }
+
+    [Fact]
+    public async Task FilterKeepsLastMatchingLines()
+    {
+        using var stream = Open("INFO a\nWARN b\nINFO c\nwarn d\nINFO e\n");
+
+        var tail = await LogTailReader.ReadLastLinesAsync(stream, "warn", 10, cancellationToken: TestContext.Current.CancellationToken);
+
+        Assert.Equal(new[] { "WARN b", "warn d" }, tail.Lines);
+    }
+
+    [Fact]
+    public async Task FilterWithNoMatchesReturnsNoLines()
+    {
+        using var stream = Open("INFO a\nINFO b\n");
+
+        var tail = await LogTailReader.ReadLastLinesAsync(stream, "error", 10, cancellationToken: TestContext.Current.CancellationToken);
+
+        Assert.Empty(tail.Lines);
+        Assert.Equal(stream.Length, tail.Length);
+    }
+
+    private static MemoryStream Open(string text)
+    {
+        return new MemoryStream(Encoding.UTF8.GetBytes(text));
+    }
+}